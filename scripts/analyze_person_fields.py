@@ -41,19 +41,33 @@ def analyze_fields(csv_path: Path) -> dict[str, list[str]]:
             "organization",
         ]
 
+        # Seen values per field
+        field_seen: dict[str, set[str]] = defaultdict(set)
+        # Stop scanning once every matching column has its 20 samples
+        matching_fields = {
+            field
+            for field in reader.fieldnames or []
+            if any(keyword in field.lower() for keyword in name_keywords)
+        }
+        saturated: set[str] = set()
+
         for row in reader:
             for field, value in row.items():
+                # Check if field name suggests it contains names
+                if field not in matching_fields or field in saturated:
+                    continue
+
                 if value and value.strip():
-                    # Check if field name suggests it contains names
-                    if any(
-                        keyword in field.lower() for keyword in name_keywords
-                    ):
-                        # Avoid duplicates, keep max 20 samples per field
-                        if (
-                            value not in field_samples[field]
-                            and len(field_samples[field]) < 20
-                        ):
-                            field_samples[field].append(value)
+                    # Avoid duplicates, keep max 20 samples per field
+                    seen = field_seen[field]
+                    if value not in seen:
+                        seen.add(value)
+                        field_samples[field].append(value)
+                        if len(seen) >= 20:
+                            saturated.add(field)
+
+            if matching_fields and saturated >= matching_fields:
+                break
 
     return dict(field_samples)
 
@@ -8,31 +8,54 @@ Usage:
     python scripts/batch_processor.py
     python scripts/batch_processor.py --max-rows-per-file 10000
     python scripts/batch_processor.py --output-dir output/batch
+    python scripts/batch_processor.py --emit-csv  # also keep MUIS CSV files
+    python scripts/batch_processor.py --archive-format xlsx  # Excel for archives too
 """
 
 import argparse
 import csv
 import logging
+import logging.handlers
+import multiprocessing
+import os
+import queue
+import re
 import sys
-from collections import defaultdict
+import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import ExitStack, contextmanager
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, TextIO
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from tqdm import tqdm
 
-from scripts.convert_row import convert_row
-from scripts.csv_to_excel import csv_to_excel
-from scripts.muis_writer import write_muis_csv
+from scripts.convert_row import convert_batch, convert_row
+from scripts.muis_writer import write_muis_csv, write_muis_excel
 
 # Constants
 DEFAULT_INPUT_FILE = Path("entust/eksponaat.csv")
 DEFAULT_OUTPUT_DIR = Path("output")
 DEFAULT_LOG_DIR = Path("logs")
 DEFAULT_MAX_ROWS = 15_000
+LOGGER_NAME = "batch_processor"
+READ_BATCH_SIZE = 10_000
+READ_QUEUE_SIZE = 4
+# Shard files kept open while grouping records (one per collection until then)
+MAX_OPEN_SHARDS = 64
+# Read buffer for the sequential eksponaat.csv scan (default is 8 KiB)
+READ_BUFFER_SIZE = 1 << 20
+# Archive-only collections, never imported to MUIS
+ARCHIVE_COLLECTIONS = ("Maha kantud", "Arhiivraamatukogu")
+
+# Characters replaced with "_" in output filenames
+FILENAME_TRANSLATION = str.maketrans({c: "_" for c in ' /\\:*?"<>|\n'})
+MULTIPLE_UNDERSCORES = re.compile(r"_+")
 
 
 def setup_logging(log_dir: Path) -> logging.Logger:
@@ -47,7 +70,7 @@ def setup_logging(log_dir: Path) -> logging.Logger:
     log_dir.mkdir(exist_ok=True)
     log_file = log_dir / f"batch_processor_{datetime.now():%Y%m%d_%H%M%S}.log"
 
-    logger = logging.getLogger("batch_processor")
+    logger = logging.getLogger(LOGGER_NAME)
     logger.setLevel(logging.INFO)
 
     # File handler
@@ -70,6 +93,45 @@ def setup_logging(log_dir: Path) -> logging.Logger:
     return logger
 
 
+def init_worker_logging(log_queue: "multiprocessing.Queue[Any]", level: int) -> None:
+    """Pool initializer: send worker log records to the parent process.
+
+    A spawned worker (macOS/Windows) has no handlers on LOGGER_NAME, and a
+    forked one would write to the parent's handlers on its own; replace
+    them with a single queue handler either way.
+
+    Args:
+        log_queue: Queue drained by worker_log_forwarding() in the parent
+        level: Level of the parent's logger
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    logger.setLevel(level)
+    logger.propagate = False
+
+
+@contextmanager
+def worker_log_forwarding(logger: logging.Logger) -> Iterator["multiprocessing.Queue[Any]"]:
+    """Forward records logged by pool workers to this logger's handlers.
+
+    Args:
+        logger: Logger whose handlers should receive worker records
+
+    Yields:
+        Queue to pass to init_worker_logging() as the pool initializer argument
+    """
+    log_queue: "multiprocessing.Queue[Any]" = multiprocessing.Queue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *logger.handlers, respect_handler_level=True
+    )
+    listener.start()
+    try:
+        yield log_queue
+    finally:
+        listener.stop()
+        log_queue.close()
+
+
 def clean_kuuluvus(value: str) -> str:
     """Clean kuuluvus field by removing duplicate collection names.
     
@@ -110,122 +172,242 @@ def sanitize_filename(name: str) -> str:
     Returns:
         Sanitized filename-safe string
     """
-    # Replace problematic characters
-    replacements = {
-        " ": "_",
-        "/": "_",
-        "\\": "_",
-        ":": "_",
-        "*": "_",
-        "?": "_",
-        '"': "_",
-        "<": "_",
-        ">": "_",
-        "|": "_",
-        "\n": "_",
-    }
-    
-    sanitized = name
-    for old, new in replacements.items():
-        sanitized = sanitized.replace(old, new)
-    
-    # Remove multiple underscores
-    while "__" in sanitized:
-        sanitized = sanitized.replace("__", "_")
+    # Replace problematic characters and collapse repeated underscores
+    sanitized = MULTIPLE_UNDERSCORES.sub("_", name.translate(FILENAME_TRANSLATION))
     
     return sanitized.strip("_")
 
 
+def read_row_batches(reader: Any, batches: "queue.Queue[Any]", batch_size: int) -> None:
+    """Producer: parse CSV rows in a background thread and queue them in batches.
+
+    Puts lists of up to ``batch_size`` rows onto ``batches`` and finishes with
+    a ``None`` sentinel. Blank lines are skipped, as csv.DictReader does. A
+    parse error is queued as the exception itself so the consumer can
+    re-raise it.
+
+    Args:
+        reader: csv.reader positioned after the header row
+        batches: Bounded queue shared with the consumer
+        batch_size: Number of rows per batch
+    """
+    rows = filter(None, reader)  # csv.reader yields [] for a blank line
+    try:
+        while batch := list(islice(rows, batch_size)):
+            batches.put(batch)
+    except Exception as e:
+        batches.put(e)
+    finally:
+        batches.put(None)
+
+
+def close_shard_files(shard_files: dict[str, TextIO]) -> None:
+    """Close every shard file still open at the end of read_and_group_records."""
+    for shard_file in shard_files.values():
+        shard_file.close()
+    shard_files.clear()
+
+
 def read_and_group_records(
-    input_file: Path, logger: logging.Logger
-) -> dict[str, list[dict[str, Any]]]:
-    """Read ENTU CSV and group records by kuuluvus.
+    input_file: Path, shard_dir: Path, logger: logging.Logger
+) -> dict[str, Path]:
+    """Read ENTU CSV and split records into per-kuuluvus shard files.
+
+    Each collection's rows are appended to its own CSV shard in ``shard_dir``
+    as they are read (header first), so the full input is never held in
+    memory; a collection is loaded back with ``load_shard`` only when it is
+    converted. CSV parsing runs in a producer thread (``read_row_batches``)
+    feeding a bounded queue, so reading overlaps with shard writing.
+
+    At most MAX_OPEN_SHARDS shard files are open at once; beyond that the
+    oldest is closed and reopened for append when its collection recurs.
+    A row with a bad kuuluvus is logged and skipped, but a shard that cannot
+    be opened or written raises OSError and aborts the read.
 
     Args:
         input_file: Path to entust/eksponaat.csv
+        shard_dir: Directory for the per-collection shard files
         logger: Logger instance
 
     Returns:
-        Dictionary mapping kuuluvus -> list of records
+        Dictionary mapping kuuluvus -> shard file path
     """
     logger.info(f"Reading records from {input_file}...")
     
     if not input_file.exists():
         raise FileNotFoundError(f"Input file not found: {input_file}")
     
-    groups: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    shards: dict[str, Path] = {}
+    # Open shard files and their writers, oldest first; at most MAX_OPEN_SHARDS
+    shard_files: dict[str, TextIO] = {}
+    writers: dict[str, Any] = {}
+    # Raw kuuluvus value -> cleaned collection name (few distinct values)
+    collection_names: dict[str, str] = {}
+    record_count = 0
     error_count = 0
-    
-    with open(input_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        
-        for row in tqdm(reader, desc="Reading records", unit=" records"):
-            try:
-                kuuluvus = row.get("kuuluvus", "").strip()
-                
-                # Clean duplicate collection names
-                kuuluvus = clean_kuuluvus(kuuluvus)
-                
-                if not kuuluvus:
-                    kuuluvus = "(no_collection)"
-                    logger.warning(f"Record {row.get('_id', 'unknown')} has no kuuluvus")
-                
-                groups[kuuluvus].append(row)
-                
-            except Exception as e:
-                error_count += 1
-                logger.error(f"Error reading record: {e}", exc_info=True)
-    
-    logger.info(f"Read {sum(len(g) for g in groups.values())} records into {len(groups)} collections")
+
+    with ExitStack() as stack:
+        f = stack.enter_context(
+            open(input_file, "r", encoding="utf-8", newline="", buffering=READ_BUFFER_SIZE)
+        )
+        stack.callback(close_shard_files, shard_files)
+        reader = csv.reader(f)
+        header = next(reader, [])
+
+        if "kuuluvus" not in header:
+            raise ValueError(f"Input file has no 'kuuluvus' column: {input_file}")
+        kuuluvus_idx = header.index("kuuluvus")
+        id_idx = header.index("_id") if "_id" in header else None
+
+        batches: queue.Queue[Any] = queue.Queue(maxsize=READ_QUEUE_SIZE)
+        producer = threading.Thread(
+            target=read_row_batches, args=(reader, batches, READ_BATCH_SIZE), daemon=True
+        )
+        producer.start()
+        progress = stack.enter_context(tqdm(desc="Reading records", unit=" records"))
+
+        while (batch := batches.get()) is not None:
+            if isinstance(batch, Exception):
+                raise batch
+            progress.update(len(batch))
+
+            for row in batch:
+                try:
+                    raw = row[kuuluvus_idx] if kuuluvus_idx < len(row) else ""
+
+                    kuuluvus = collection_names.get(raw)
+                    if kuuluvus is None:
+                        # Clean duplicate collection names
+                        kuuluvus = clean_kuuluvus(raw.strip())
+                        collection_names[raw] = kuuluvus
+
+                    if not kuuluvus:
+                        kuuluvus = "(no_collection)"
+                        record_id = (
+                            row[id_idx] if id_idx is not None and id_idx < len(row) else "unknown"
+                        )
+                        logger.warning(f"Record {record_id} has no kuuluvus")
+                except Exception as e:
+                    error_count += 1
+                    logger.error(f"Error reading record: {e}", exc_info=True)
+                    continue
+
+                # Shard I/O errors (disk full, too many open files) abort the read
+                writer = writers.get(kuuluvus)
+                if writer is None:
+                    if len(shard_files) >= MAX_OPEN_SHARDS:
+                        # Close the oldest open shard; it is reopened for append if needed
+                        oldest = next(iter(shard_files))
+                        shard_files.pop(oldest).close()
+                        del writers[oldest]
+
+                    shard_path = shards.get(kuuluvus)
+                    new_shard = shard_path is None
+                    if shard_path is None:
+                        shard_path = shard_dir / f"shard_{len(shards):03d}.csv"
+                        shards[kuuluvus] = shard_path
+
+                    shard_file = open(
+                        shard_path, "w" if new_shard else "a", encoding="utf-8", newline=""
+                    )
+                    shard_files[kuuluvus] = shard_file
+                    writer = writers[kuuluvus] = csv.writer(shard_file)
+                    if new_shard:
+                        writer.writerow(header)
+
+                writer.writerow(row)
+                record_count += 1
+
+    logger.info(f"Read {record_count} records into {len(shards)} collections")
     if error_count > 0:
         logger.warning(f"Encountered {error_count} errors while reading")
     
-    return groups
+    return shards
+
+
+def load_shard(shard_path: Path) -> tuple[list[str], list[list[str]]]:
+    """Load one collection's rows from its shard file.
+
+    Args:
+        shard_path: Shard written by read_and_group_records
+
+    Returns:
+        Tuple of (header, rows)
+    """
+    with open(shard_path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        return header, list(reader)
 
 
-def split_large_collection(
-    records: list[dict[str, Any]], max_rows: int
-) -> list[list[dict[str, Any]]]:
-    """Split collection into chunks if it exceeds max_rows.
+def record_to_dict(header: list[str], row: list[str]) -> dict[str, Any]:
+    """Build the column -> value dict that convert_row expects for a raw row.
 
     Args:
-        records: List of records in collection
+        header: CSV header row
+        row: Raw CSV row (field list)
+
+    Returns:
+        Dictionary mapping column names to values
+    """
+    return dict(zip(header, row))
+
+
+def chunk_bounds(num_records: int, max_rows: int) -> list[tuple[int, int]]:
+    """Compute (start, stop) index bounds for splitting a collection.
+
+    Chunks are sliced from the collection only when they are submitted for
+    conversion, so the rows are never copied into all chunk lists up front.
+
+    Args:
+        num_records: Number of records in collection
         max_rows: Maximum rows per file
 
     Returns:
-        List of record chunks
+        List of (start, stop) bounds, one per output file
     """
-    if len(records) <= max_rows:
-        return [records]
-    
-    chunks: list[list[dict[str, Any]]] = []
-    for i in range(0, len(records), max_rows):
-        chunks.append(records[i : i + max_rows])
+    if num_records <= max_rows:
+        return [(0, num_records)]
     
-    return chunks
+    return [
+        (start, min(start + max_rows, num_records))
+        for start in range(0, num_records, max_rows)
+    ]
 
 
 def convert_collection(
     collection_name: str,
-    records: list[dict[str, Any]],
+    header: list[str],
+    records: list[list[str]],
     chunk_num: int | None,
     total_chunks: int,
     output_dir: Path,
-    logger: logging.Logger,
+    emit_csv: bool = False,
+    output_format: str = "xlsx",
+    debug: bool = False,
 ) -> tuple[Path | None, int, int]:
-    """Convert a collection (or chunk) to MUIS format and Excel.
+    """Convert a collection (or chunk) to MUIS format and Excel (or CSV).
+
+    Runs in a worker process, so it logs through the module logger instead
+    of taking a (non-picklable) logger argument.
 
     Args:
         collection_name: Name of collection (kuuluvus)
-        records: List of records to convert
+        header: CSV header row (column names for the raw rows)
+        records: List of raw rows to convert
         chunk_num: Chunk number (None if not split)
         total_chunks: Total number of chunks for this collection
         output_dir: Output directory for files
-        logger: Logger instance
+        emit_csv: Also write the intermediate MUIS CSV (for debugging)
+        output_format: "xlsx", or "csv" to write only the MUIS CSV
+            (used for archive collections)
+        debug: Log a full traceback for every failed record
 
     Returns:
-        Tuple of (excel_path, success_count, error_count)
+        Tuple of (output_path, success_count, error_count)
     """
+    logger = logging.getLogger(LOGGER_NAME)
+
     # Generate filename
     safe_name = sanitize_filename(collection_name)
     if chunk_num is not None:
@@ -236,57 +418,93 @@ def convert_collection(
     csv_path = output_dir / f"{filename}.csv"
     excel_path = output_dir / f"{filename}.xlsx"
     
-    logger.info(f"Converting {collection_name}: {len(records)} records -> {excel_path.name}")
+    output_path = csv_path if output_format == "csv" else excel_path
+    logger.info(f"Converting {collection_name}: {len(records)} records -> {output_path.name}")
     
     # Convert records
     converted_records: list[dict[str, Any]] = []
     error_count = 0
     
-    for record in tqdm(records, desc=f"Converting {collection_name}", unit=" records", leave=False):
-        try:
-            converted = convert_row(record)
-            converted_records.append(converted)
-        except Exception as e:
-            error_count += 1
-            record_id = record.get("_id", "unknown")
+    try:
+        converted_records = convert_batch(header, records)
+    except Exception as e:
+        # Fall back to row-by-row conversion to isolate the failing records
+        logger.warning(
+            f"Batch conversion failed for {collection_name} "
+            f"({type(e).__name__}: {e}), retrying row by row",
+            exc_info=True,
+        )
+        # Preallocate and bind the per-row callables locally for the hot loop
+        converted: list[Any] = [None] * len(records)
+        to_dict = record_to_dict
+        convert = convert_row
+        n = 0
+        # (record_id, error type, message), logged once after the loop
+        failures: list[tuple[str, str, str]] = []
+        for row in records:
+            record = to_dict(header, row)
+            try:
+                converted[n] = convert(record)
+                n += 1
+            except Exception as e:
+                record_id = record.get("_id", "unknown")
+                failures.append((record_id, type(e).__name__, str(e)))
+                if debug:
+                    logger.error(
+                        f"Error converting record {record_id} in {collection_name}: {e}",
+                        exc_info=True,
+                    )
+        del converted[n:]
+        converted_records = converted
+
+        error_count = len(failures)
+        if failures:
             logger.error(
-                f"Error converting record {record_id} in {collection_name}: {e}",
-                exc_info=True,
+                f"{error_count} conversion errors in {collection_name}. "
+                f"First {min(error_count, 10)}: {failures[:10]}"
             )
     
     if not converted_records:
         logger.warning(f"No records successfully converted for {collection_name}")
         return None, 0, error_count
     
-    # Write MUIS CSV
-    try:
-        write_muis_csv(converted_records, csv_path)
-        logger.debug(f"Wrote MUIS CSV: {csv_path}")
-    except Exception as e:
-        logger.error(f"Error writing MUIS CSV for {collection_name}: {e}", exc_info=True)
-        return None, len(converted_records), error_count
+    # Write MUIS CSV (optional, Excel is written directly from records)
+    if emit_csv or output_format == "csv":
+        try:
+            write_muis_csv(converted_records, csv_path)
+            logger.debug(f"Wrote MUIS CSV: {csv_path}")
+        except Exception as e:
+            logger.error(f"Error writing MUIS CSV for {collection_name}: {e}", exc_info=True)
+            return None, len(converted_records), error_count
+
+    if output_format == "csv":
+        return csv_path, len(converted_records), error_count
     
-    # Convert to Excel
+    # Write Excel
     try:
-        csv_to_excel(csv_path, excel_path)
-        logger.debug(f"Converted to Excel: {excel_path}")
+        write_muis_excel(converted_records, excel_path)
+        logger.debug(f"Wrote Excel: {excel_path}")
     except Exception as e:
-        logger.error(f"Error converting to Excel for {collection_name}: {e}", exc_info=True)
+        logger.error(f"Error writing Excel for {collection_name}: {e}", exc_info=True)
         return None, len(converted_records), error_count
     
     return excel_path, len(converted_records), error_count
 
 
-def create_archive_readme(collection_name: str, output_dir: Path) -> None:
+def create_archive_readme(
+    collection_name: str, output_dir: Path, data_files: list[Path]
+) -> None:
     """Create README file for archive-only collections.
 
     Args:
         collection_name: Name of archive collection
         output_dir: Output directory for README
+        data_files: Files generated for the collection
     """
+    file_list = "\n".join(f"- {path.name}" for path in data_files) or "- (puuduvad)"
     readme_content = f"""# {collection_name} - Arhiivikogud
 
-⚠️ **TÄHELEPANU**: See fail on ainult arhiiviviite eesmärgil.
+⚠️ **TÄHELEPANU**: Need failid on ainult arhiiviviite eesmärgil.
 
 ## Miks ei impordi MuISi?
 
@@ -295,16 +513,20 @@ Kogu "{collection_name}" sisaldab museaale, mis on:
 - Arhiivraamatukogus (ei ole muuseumikogud)
 - Mitte ettenähtud MuISi massimpordi jaoks
 
+## Failid
+
+{file_list}
+
 ## Kasutamine
 
-Seda faili saab kasutada:
+Neid faile saab kasutada:
 - Ajalooliste andmete võrdlemiseks
 - Arhiiviviidete kontrollimiseks
 - Statistiliste aruannete koostamiseks
 
 ## MUIS Import
 
-❌ **Ära impordi seda faili MuISi!**
+❌ **Ära impordi neid faile MuISi!**
 
 Kontrolli Liisi või teiste kureerimise vastutajatega, kui on küsimusi.
 
@@ -320,7 +542,7 @@ Genereeritud: {datetime.now():%Y-%m-%d %H:%M}
 
 
 def generate_summary_report(
-    groups: dict[str, list[dict[str, Any]]],
+    group_sizes: dict[str, int],
     results: dict[str, tuple[list[Path], int, int]],
     output_dir: Path,
     logger: logging.Logger,
@@ -328,14 +550,14 @@ def generate_summary_report(
     """Generate summary report of batch processing.
 
     Args:
-        groups: Original grouped records
+        group_sizes: Input record count per collection
         results: Processing results per collection
         output_dir: Output directory
         logger: Logger instance
     """
     report_path = output_dir / f"batch_summary_{datetime.now():%Y%m%d_%H%M%S}.txt"
     
-    total_input = sum(len(g) for g in groups.values())
+    total_input = sum(group_sizes.values())
     total_success = sum(r[1] for r in results.values())
     total_errors = sum(r[2] for r in results.values())
     total_files = sum(len(r[0]) for r in results.values())
@@ -350,7 +572,7 @@ def generate_summary_report(
         f"  Input records:        {total_input:>10,}",
         f"  Successfully converted: {total_success:>10,} ({total_success/total_input*100:.2f}%)",
         f"  Conversion errors:    {total_errors:>10,} ({total_errors/total_input*100:.2f}%)",
-        f"  Excel files generated: {total_files:>10}",
+        f"  Output files generated: {total_files:>9}",
         "",
         "COLLECTIONS:",
         "-" * 70,
@@ -358,11 +580,11 @@ def generate_summary_report(
     
     # Sort by record count descending
     sorted_collections = sorted(
-        results.items(), key=lambda x: sum(len(g) for g in groups.values() if g), reverse=True
+        results.items(), key=lambda kv: group_sizes.get(kv[0], 0), reverse=True
     )
     
     for collection_name, (files, _success, errors) in sorted_collections:
-        input_count = len(groups[collection_name])
+        input_count = group_sizes[collection_name]
         report.append(
             f"  {collection_name:<30} {input_count:>6,} records -> {len(files):>2} file(s)"
         )
@@ -426,6 +648,32 @@ def main() -> int:
         help=f"Maximum rows per file (default: {DEFAULT_MAX_ROWS})",
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes for conversion (default: CPU count)",
+    )
+
+    parser.add_argument(
+        "--emit-csv",
+        action="store_true",
+        help="Also write the intermediate MUIS CSV next to each Excel file",
+    )
+
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Log a full traceback for every record that fails to convert",
+    )
+
+    parser.add_argument(
+        "--archive-format",
+        choices=["csv", "xlsx"],
+        default="csv",
+        help="Output format for archive-only collections (default: csv)",
+    )
+
     args = parser.parse_args()
     
     # Setup
@@ -440,52 +688,91 @@ def main() -> int:
     logger.info(f"Max rows per file: {args.max_rows_per_file:,}")
     
     try:
-        # Read and group records
-        groups = read_and_group_records(args.input, logger)
-        
-        # Process each collection
-        results: dict[str, tuple[list[Path], int, int]] = {}
-        
-        for collection_name, records in groups.items():
-            logger.info(f"\nProcessing collection: {collection_name} ({len(records):,} records)")
+        # Read and group records (each collection spilled to its own shard)
+        with tempfile.TemporaryDirectory(prefix="vabamu_shards_") as shard_dir:
+            shards = read_and_group_records(args.input, Path(shard_dir), logger)
             
-            # Split if needed
-            chunks = split_large_collection(records, args.max_rows_per_file)
-            total_chunks = len(chunks)
+            # Process each collection
+            group_sizes: dict[str, int] = {}
+            chunk_results: dict[str, list[tuple[Path | None, int, int]]] = {}
+            pending: dict[Future[tuple[Path | None, int, int]], tuple[str, int]] = {}
             
-            if total_chunks > 1:
-                logger.info(f"  Splitting into {total_chunks} files ({args.max_rows_per_file:,} rows each)")
+            def collect(done: set[Future[tuple[Path | None, int, int]]]) -> None:
+                for future in done:
+                    collection_name, chunk_idx = pending.pop(future)
+                    chunk_results[collection_name][chunk_idx] = future.result()
+                    progress.update(1)
             
-            collection_files: list[Path] = []
-            collection_success = 0
-            collection_errors = 0
-            
-            for i, chunk in enumerate(chunks, start=1):
-                chunk_num = i if total_chunks > 1 else None
-                
-                excel_path, success, errors = convert_collection(
-                    collection_name,
-                    chunk,
-                    chunk_num,
-                    total_chunks,
-                    args.output_dir,
-                    logger,
-                )
+            # Listener outlives the pool, so it drains every worker record
+            with worker_log_forwarding(logger) as log_queue, ProcessPoolExecutor(
+                max_workers=args.workers,
+                initializer=init_worker_logging,
+                initargs=(log_queue, logger.level),
+            ) as executor, tqdm(desc="Converting chunks", unit=" files") as progress:
+                for collection_name, shard_path in shards.items():
+                    header, records = load_shard(shard_path)
+                    group_sizes[collection_name] = len(records)
+                    logger.info(
+                        f"\nProcessing collection: {collection_name} ({len(records):,} records)"
+                    )
+
+                    # Split if needed
+                    bounds = chunk_bounds(len(records), args.max_rows_per_file)
+                    total_chunks = len(bounds)
+
+                    if total_chunks > 1:
+                        logger.info(
+                            f"  Splitting into {total_chunks} files "
+                            f"({args.max_rows_per_file:,} rows each)"
+                        )
+
+                    chunk_results[collection_name] = [(None, 0, 0)] * total_chunks
+                    progress.total = (progress.total or 0) + total_chunks
+
+                    for i, (start, stop) in enumerate(bounds, start=1):
+                        chunk_num = i if total_chunks > 1 else None
+
+                        # Bound queued chunks so only a few collections are in memory
+                        if len(pending) >= 2 * args.workers:
+                            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                            collect(done)
+
+                        future = executor.submit(
+                            convert_collection,
+                            collection_name,
+                            header,
+                            records[start:stop] if total_chunks > 1 else records,
+                            chunk_num,
+                            total_chunks,
+                            args.output_dir,
+                            emit_csv=args.emit_csv,
+                            output_format=(
+                                args.archive_format
+                                if collection_name in ARCHIVE_COLLECTIONS
+                                else "xlsx"
+                            ),
+                            debug=args.debug,
+                        )
+                        pending[future] = (collection_name, i - 1)
                 
-                if excel_path:
-                    collection_files.append(excel_path)
-                collection_success += success
-                collection_errors += errors
+                collect(wait(pending).done)
             
-            results[collection_name] = (collection_files, collection_success, collection_errors)
-            
-            # Create README for archive collections
-            if collection_name in ["Maha kantud", "Arhiivraamatukogu"]:
-                create_archive_readme(collection_name, args.output_dir)
-                logger.info(f"  Created archive README for {collection_name}")
+            results: dict[str, tuple[list[Path], int, int]] = {}
+            for collection_name, chunk_list in chunk_results.items():
+                results[collection_name] = (
+                    [path for path, _, _ in chunk_list if path],
+                    sum(success for _, success, _ in chunk_list),
+                    sum(errors for _, _, errors in chunk_list),
+                )
+
+        # Create README for archive collections
+        for collection_name in ARCHIVE_COLLECTIONS:
+            if collection_name in results:
+                create_archive_readme(collection_name, args.output_dir, results[collection_name][0])
+                logger.info(f"Created archive README for {collection_name}")
         
         # Generate summary
-        generate_summary_report(groups, results, args.output_dir, logger)
+        generate_summary_report(group_sizes, results, args.output_dir, logger)
         
         logger.info("\n" + "=" * 70)
         logger.info("BATCH PROCESSOR COMPLETED SUCCESSFULLY")
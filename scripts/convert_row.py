@@ -10,9 +10,12 @@ Pipeline:
 5. Vocab mapper: materials, techniques, colors → terms
 
 Returns: Dictionary with mapped MUIS fields ready for CSV output
+
+convert_batch() runs the same pipeline column-wise over a list of raw CSV
+rows, calling each parser once per distinct value in a column.
 """
 
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Sequence
 from scripts.parsers.number_parser import parse_entu_code
 from scripts.parsers.dimension_parser import parse_dimensions
 from scripts.parsers.date_parser import convert_date
@@ -23,6 +26,10 @@ from scripts.parsers.vocab_mapper import (
     map_color,
 )
 
+NUMBER_FIELDS = ("acr", "trt", "trs", "trj", "trl", "kt", "ks", "kj", "kl")
+# Number fields for a missing or unparseable code
+EMPTY_NUMBER_FIELDS: Dict[str, Any] = dict.fromkeys(NUMBER_FIELDS)
+
 
 def convert_row(entu_row: Dict[str, Any]) -> Dict[str, Any]:
     """Convert single ENTU row to MUIS format by orchestrating all parsers.
@@ -53,26 +60,10 @@ def convert_row(entu_row: Dict[str, Any]) -> Dict[str, Any]:
             result.update(number_parsed)
         except (ValueError, KeyError):
             # Code parsing failed - set error indicators
-            result["acr"] = None
-            result["trt"] = None
-            result["trs"] = None
-            result["trj"] = None
-            result["trl"] = None
-            result["kt"] = None
-            result["ks"] = None
-            result["kj"] = None
-            result["kl"] = None
+            result.update(EMPTY_NUMBER_FIELDS)
     else:
         # No code provided
-        result["acr"] = None
-        result["trt"] = None
-        result["trs"] = None
-        result["trj"] = None
-        result["trl"] = None
-        result["kt"] = None
-        result["ks"] = None
-        result["kj"] = None
-        result["kl"] = None
+        result.update(EMPTY_NUMBER_FIELDS)
 
     # =================================================================
     # PHASE 2: DIMENSION PARSER - Parse dimensions (ø, HxW, HxWxD)
@@ -154,3 +145,102 @@ def convert_row(entu_row: Dict[str, Any]) -> Dict[str, Any]:
     result["legend"] = entu_row.get("legend", "")
 
     return result
+
+
+def _column(
+    index: Dict[str, int], rows: Sequence[Sequence[str]], name: str
+) -> List[str]:
+    """Extract one column from raw rows ("" if the column is missing)."""
+    idx = index.get(name)
+    if idx is None:
+        return [""] * len(rows)
+    return [row[idx] if idx < len(row) else "" for row in rows]
+
+
+def _map_unique(func: Callable[[str], Any], column: Sequence[str]) -> List[Any]:
+    """Apply func once per distinct value in column and broadcast the results."""
+    cache: Dict[str, Any] = {}
+    for value in column:
+        if value not in cache:
+            cache[value] = func(value)
+    return [cache[value] for value in column]
+
+
+def _parse_code(code: str) -> Dict[str, Any]:
+    """Number parser with convert_row's fallback for empty/invalid codes."""
+    if code:
+        try:
+            return parse_entu_code(code)
+        except (ValueError, KeyError):
+            pass
+    return EMPTY_NUMBER_FIELDS
+
+
+def convert_batch(
+    header: Sequence[str], rows: Sequence[Sequence[str]]
+) -> List[Dict[str, Any]]:
+    """Convert raw ENTU CSV rows to MUIS format, one parser pass per column.
+
+    Equivalent to ``[convert_row(dict(zip(header, row))) for row in rows]``,
+    but codes, dates, persons and vocabulary paths repeat heavily within a
+    collection, so each parser runs once per distinct value instead of once
+    per row. Dimensions are parsed per row since their result lists are
+    handed out to each record.
+
+    Args:
+        header: CSV header row (column names)
+        rows: Raw CSV rows (from csv.reader)
+
+    Returns:
+        List of dictionaries with MUIS fields, one per input row
+    """
+
+    # Last occurrence wins for duplicate names, as with dict(zip(header, row))
+    index = {name: i for i, name in enumerate(header)}
+
+    def col(name: str) -> List[str]:
+        return _column(index, rows, name)
+
+    codes = col("code")
+    donators = col("donator")
+    autors = col("autor")
+
+    numbers = _map_unique(_parse_code, codes)
+    measurements = [parse_dimensions(value) for value in col("dimensions")]
+    dates = _map_unique(convert_date, col("date"))
+    mapped_donators = _map_unique(map_person, donators)
+    mapped_autors = _map_unique(map_person, autors)
+    materials = _map_unique(map_material, col("materials"))
+    techniques = _map_unique(map_technique, col("techniques"))
+    colors = _map_unique(map_color, col("colors"))
+
+    # Output columns after the number fields, in convert_row's key order.
+    # Pass-through fields are plain projections of the input columns.
+    columns = {
+        "measurements": measurements,
+        "date": dates,
+        "donator": mapped_donators,
+        "autor": mapped_autors,
+        "material": materials,
+        "technique": techniques,
+        "color": colors,
+        "name": col("name"),
+        "description": col("description"),
+        "donator_direct": donators,
+        "autor_direct": autors,
+        "vastuvotuakt": col("vastuv6tuakt"),
+        "code_original": codes,
+        "asukoht": col("asukoht"),
+        "year": col("year"),
+        "public_legend": col("public_legend"),
+        "legend": col("legend"),
+    }
+    keys = tuple(columns)
+
+    results: List[Dict[str, Any]] = []
+    for number_fields, values in zip(numbers, zip(*columns.values())):
+        result: Dict[str, Any] = dict(number_fields)
+        result.update(zip(keys, values))
+        results.append(result)
+
+    return results
@@ -17,13 +17,92 @@ Usage:
 import argparse
 import csv
 import sys
+from itertools import zip_longest
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Optional, Sequence
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Font
 from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.worksheet import Worksheet
+
+# Shared styles for header rows (one instance instead of one per cell)
+HEADER_FONT = Font(bold=True)
+HEADER_ALIGNMENT = Alignment(horizontal="left", vertical="top")
+
+# Auto-width cap (characters)
+MAX_COLUMN_WIDTH = 50
+
+
+def column_widths(rows: Iterable[Sequence[Any]]) -> list[int]:
+    """Calculate auto-adjusted column widths for rows.
+
+    Args:
+        rows: Rows of cell values
+
+    Returns:
+        Width per column (longest value + padding, capped at MAX_COLUMN_WIDTH)
+    """
+    max_lengths: list[int] = []
+
+    for row in rows:
+        if len(row) > len(max_lengths):
+            max_lengths.extend([0] * (len(row) - len(max_lengths)))
+
+        for col_idx, value in enumerate(row):
+            if value:
+                max_lengths[col_idx] = max(max_lengths[col_idx], len(str(value)))
+
+    return [min(length + 2, MAX_COLUMN_WIDTH) for length in max_lengths]
+
+
+def rows_to_excel(
+    rows: Iterable[Sequence[Any]],
+    excel_path: Path,
+    freeze_header_rows: int = 3,
+    widths: Optional[Sequence[int]] = None,
+) -> Path:
+    """Stream rows into an Excel file using a write-only workbook.
+
+    Rows are written to disk as they are appended, so memory use does not
+    grow with the row count. Column widths and frozen panes must be known
+    before the first row is written.
+
+    Args:
+        rows: Rows of cell values (None cells are left empty)
+        excel_path: Path to output Excel file
+        freeze_header_rows: Number of bold header rows to freeze (default: 3)
+        widths: Optional column widths (see column_widths)
+
+    Returns:
+        Path to created Excel file
+    """
+    excel_path = Path(excel_path)
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title="MUIS Export")
+
+    if freeze_header_rows > 0:
+        ws.freeze_panes = f"A{freeze_header_rows + 1}"
+
+    if widths:
+        for col_idx, width in enumerate(widths, start=1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = width
+
+    for row_idx, row in enumerate(rows, start=1):
+        if row_idx <= freeze_header_rows:
+            header_cells = []
+            for value in row:
+                cell = WriteOnlyCell(ws, value=value)
+                cell.font = HEADER_FONT
+                cell.alignment = HEADER_ALIGNMENT
+                header_cells.append(cell)
+            ws.append(header_cells)
+        else:
+            ws.append(row)
+
+    wb.save(excel_path)
+    return excel_path
 
 
 def csv_to_excel(
@@ -34,6 +113,8 @@ def csv_to_excel(
 ) -> Path:
     """Convert MUIS CSV to Excel with formatting.
 
+    The sheet is streamed through rows_to_excel (write-only workbook).
+
     Args:
         csv_path: Path to input CSV file
         excel_path: Path to output Excel file (optional, auto-generated if None)
@@ -57,60 +138,25 @@ def csv_to_excel(
     else:
         excel_path = Path(excel_path)
 
-    # Create new workbook
-    wb = Workbook()
-    ws: Worksheet = wb.active  # type: ignore[assignment]
-    ws.title = "MUIS Export"
-
-    # Read CSV and write to Excel
+    # Read CSV (blank lines are kept so rows stay at their CSV line numbers)
     with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.reader(f)
-        rows_written = 0
-
-        for row_idx, row in enumerate(reader, start=1):
-            if not row:
-                continue
-
-            # Write row to Excel
-            for col_idx, value in enumerate(row, start=1):
-                cell = ws.cell(row=row_idx, column=col_idx, value=value)
-
-                # Format header rows (first 3 rows)
-                if row_idx <= freeze_header_rows:
-                    cell.font = Font(bold=True)
-                    cell.alignment = Alignment(horizontal="left", vertical="top")
-
-            rows_written += 1
+        rows = list(csv.reader(f))
 
-    if rows_written == 0:
+    if not any(rows):
         raise ValueError(f"CSV file is empty: {csv_path}")
 
-    # Freeze header rows
-    if freeze_header_rows > 0:
-        # Freeze at row after header rows
-        freeze_cell = f"A{freeze_header_rows + 1}"
-        ws.freeze_panes = freeze_cell
-
-    # Auto-adjust column widths
-    if auto_width:
-        for column in ws.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)  # type: ignore[arg-type]
-
-            for cell in column:
-                if cell.value:
-                    # Calculate length, add padding
-                    cell_length = len(str(cell.value))
-                    max_length = max(max_length, cell_length)
-
-            # Set adjusted width (add padding, cap at reasonable max)
-            adjusted_width = min(max_length + 2, 50)
-            if column[0].column is not None:
-                ws.column_dimensions[column_letter].width = adjusted_width
-
-    # Save workbook
-    wb.save(excel_path)
-    return excel_path
+    # Values from csv.reader are always str, so the longest value per column
+    # is max(map(len, column)) - no per-cell branch or str() call
+    widths = (
+        [
+            min(max(map(len, column)) + 2, MAX_COLUMN_WIDTH)
+            for column in zip_longest(*rows, fillvalue="")
+        ]
+        if auto_width
+        else None
+    )
+
+    return rows_to_excel(rows, excel_path, freeze_header_rows, widths)
 
 
 def main() -> int:
@@ -13,12 +13,23 @@ Usage:
 """
 
 import csv
+import re
 from pathlib import Path
-from collections import defaultdict
-from typing import Literal
+from collections import Counter
+from enum import Enum
 import argparse
 
 
+class EntityType(str, Enum):
+    """Entity classification (compares and writes as its plain string value)"""
+
+    PERSON = "person"
+    ORGANIZATION = "organization"
+
+    def __str__(self) -> str:
+        return self.value
+
+
 # Fields that contain person/organization names (from full dataset analysis)
 PERSON_ORG_FIELDS = [
     "autor",        # Creators/authors
@@ -27,6 +38,16 @@ PERSON_ORG_FIELDS = [
     "represseeritu_t",  # Repressed persons (perpetrators/related)
 ]
 
+# Organization indicators (Estonian and English), matched against the
+# lowercased name in one pass:
+# - general keywords anywhere ("mtü" NGO needs a space before it)
+# - company suffixes " oü", " as", " sa" only at the end of the name or
+#   before a space/comma, to avoid matching surnames (e.g., "Saks", "Saul")
+ORG_PATTERN = re.compile(
+    r"muuseum|museum|instituut|institute| mtü|fond|arhiiv|archive|ülikool|university"
+    r"| (?:oü|as|sa)(?:\Z|[ ,])"
+)
+
 
 def parse_multiline_names(text: str) -> list[str]:
     """
@@ -41,11 +62,10 @@ def parse_multiline_names(text: str) -> list[str]:
     Returns:
         List of individual names (whitespace trimmed, empty lines removed)
     """
-    lines = text.replace("\r\n", "\n").split("\n")
-    return [line.strip() for line in lines if line.strip()]
+    return list(filter(None, map(str.strip, text.splitlines())))
 
 
-def classify_entity(name: str) -> Literal["person", "organization"]:
+def classify_entity(name: str) -> EntityType:
     """
     Classify whether name is a person or organization.
 
@@ -59,49 +79,18 @@ def classify_entity(name: str) -> Literal["person", "organization"]:
         name: The name string
 
     Returns:
-        'person' or 'organization'
+        EntityType.PERSON or EntityType.ORGANIZATION
     """
     # Person pattern first: "Lastname, Firstname" or "Lastname, Firstname, Middlename"
     # This prevents false matches like "Jõgiaas" matching "as"
     if "," in name:
-        return "person"
-
-    name_lower = name.lower()
-
-    # Organization indicators (Estonian and English)
-    # Must have word boundaries to avoid matching in surnames (e.g., "Saks", "Saul")
-    org_keywords = [
-        "muuseum",
-        "museum",
-        "instituut",
-        "institute",
-        " mtü",  # NGO (must have space before)
-        "fond",
-        "arhiiv",
-        "archive",
-        "ülikool",
-        "university",
-    ]
-    
-    # Company suffixes must be at word boundaries or end of string
-    # Check these separately to avoid false matches
-    org_suffixes = [" oü", " as", " sa"]
-    
-    # Check general org keywords
-    if any(keyword in name_lower for keyword in org_keywords):
-        return "organization"
-    
-    # Check company suffixes (must be at end or followed by non-letter)
-    for suffix in org_suffixes:
-        # Check if suffix is at end of string
-        if name_lower.endswith(suffix):
-            return "organization"
-        # Check if suffix is followed by space or punctuation
-        if suffix + " " in name_lower or suffix + "," in name_lower:
-            return "organization"
+        return EntityType.PERSON
+
+    if ORG_PATTERN.search(name.lower()):
+        return EntityType.ORGANIZATION
 
     # Default to person (most common case)
-    return "person"
+    return EntityType.PERSON
 
 
 def extract_persons(csv_path: Path) -> list[dict[str, str | int]]:
@@ -115,40 +104,53 @@ def extract_persons(csv_path: Path) -> list[dict[str, str | int]]:
         List of dicts with: entu_field, entu_value, entity_type,
                             frequency, sample_records
     """
-    # Track: (field, name) → [record_ids]
-    name_occurrences: dict[tuple[str, str], list[str]] = defaultdict(list)
+    # Track: (field, name) → occurrence count
+    name_counts: Counter[tuple[str, str]] = Counter()
+    # First 5 record ids per (field, name)
+    name_samples: dict[tuple[str, str], list[str]] = {}
 
     with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, [])
+
+        # Resolve column indexes once: record id from "code" (or "_id")
+        id_column = "code" if "code" in header else "_id"
+        id_idx = header.index(id_column) if id_column in header else None
+        field_indexes = [
+            (field, header.index(field)) for field in PERSON_ORG_FIELDS if field in header
+        ]
 
         for row in reader:
-            record_id = row.get("code", row.get("_id", ""))
+            record_id = row[id_idx] if id_idx is not None and id_idx < len(row) else ""
 
-            for field in PERSON_ORG_FIELDS:
-                value = row.get(field, "").strip()
+            for field, idx in field_indexes:
+                value = row[idx].strip() if idx < len(row) else ""
                 if value:
                     # Parse multiline names (some fields have multiple names)
                     names = parse_multiline_names(value)
 
                     for name in names:
-                        name_occurrences[(field, name)].append(record_id)
+                        key = (field, name)
+                        name_counts[key] += 1
+                        samples = name_samples.setdefault(key, [])
+                        if len(samples) < 5:
+                            samples.append(record_id)
 
-    # Build output records
+    # Build output records, most common first (ties by field, name)
     results: list[dict[str, str | int]] = []
-    for (field, name), record_ids in sorted(name_occurrences.items()):
+    for (field, name), count in sorted(
+        name_counts.items(), key=lambda item: (-item[1], item[0])
+    ):
         results.append(
             {
                 "entu_field": field,
                 "entu_value": name,
                 "entity_type": classify_entity(name),
-                "frequency": len(record_ids),
-                "sample_records": ", ".join(record_ids[:5]),  # First 5
+                "frequency": count,
+                "sample_records": ", ".join(name_samples[(field, name)]),
             }
         )
 
-    # Sort by frequency (most common first)
-    results.sort(key=lambda x: int(x["frequency"]), reverse=True)
-
     return results
 
 
@@ -214,10 +216,14 @@ def main() -> None:
 
     print(f"\nExtracted {len(results)} unique persons/organizations:")
 
-    # Summary stats
-    persons = sum(1 for r in results if r["entity_type"] == "person")
-    orgs = sum(1 for r in results if r["entity_type"] == "organization")
-    total_occurrences = sum(int(r["frequency"]) for r in results)
+    # Summary stats (single pass)
+    persons = orgs = total_occurrences = 0
+    for r in results:
+        total_occurrences += int(r["frequency"])
+        if r["entity_type"] is EntityType.PERSON:
+            persons += 1
+        else:
+            orgs += 1
 
     print(f"  Persons: {persons}")
     print(f"  Organizations: {orgs}")
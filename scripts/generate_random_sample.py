@@ -2,8 +2,8 @@
 """Generate a random sample of ENTU records and convert to MUIS format.
 
 This script:
-1. Reads all records from entust/eksponaat.csv
-2. Selects a random sample of N records
+1. Streams records from entust/eksponaat.csv
+2. Selects a random sample of N records (reservoir sampling, O(N) memory)
 3. Saves the raw sample to output/random_N_raw.csv
 4. Converts the sample to MUIS format using the full pipeline
 5. Saves the MUIS output to output/random_N_muis.csv
@@ -18,8 +18,10 @@ Arguments:
 
 import argparse
 import csv
+import math
 import random
 import sys
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -28,20 +30,64 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 # Project imports
-from scripts.convert_row import convert_row
+from scripts.convert_row import convert_batch, convert_row
 from scripts.muis_writer import write_muis_csv
 
 
-def load_entu_records(input_path: Path) -> list[dict[str, str]]:
-    """Load all records from ENTU eksponaat.csv."""
-    records: list[dict[str, str]] = []
+def _log_uniform(rng: random.Random) -> float:
+    """Return log(u) for u uniform in (0, 1)."""
+    return math.log(rng.random() or sys.float_info.min)
+
+
+def reservoir_sample(
+    input_path: Path, k: int, rng: random.Random
+) -> tuple[list[dict[str, str]], int]:
+    """Sample k records uniformly from ENTU eksponaat.csv in one streaming pass.
+
+    Uses reservoir sampling (Algorithm L): only the k sampled rows are kept,
+    and only they are turned into dicts. Pass a seeded random.Random for a
+    reproducible sample; the global random state is not touched.
+
+    Args:
+        input_path: Path to ENTU CSV file
+        k: Number of records to sample
+        rng: Random number generator
+
+    Returns:
+        Tuple of (sampled records, total record count)
+    """
     with open(input_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)  # Uses comma delimiter (default)
-        for row in reader:
-            # Filter out any None keys that might appear in malformed rows
-            clean_row: dict[str, str] = {k: v for k, v in row.items() if k is not None}
-            records.append(clean_row)
-    return records
+        reader = csv.reader(f)  # Uses comma delimiter (default)
+        header = next(reader, [])
+        rows = filter(None, reader)  # Skip blank lines, as DictReader does
+        reservoir = list(islice(rows, k)) if k > 0 else []
+        count = len(reservoir)
+
+        if k > 0 and count == k:
+            # Index of the next row that enters the reservoir
+            w = math.exp(_log_uniform(rng) / k)
+            next_index = k + math.floor(_log_uniform(rng) / math.log1p(-w))
+
+            for row in rows:
+                if count == next_index:
+                    reservoir[rng.randrange(k)] = row
+                    w *= math.exp(_log_uniform(rng) / k)
+                    next_index += math.floor(_log_uniform(rng) / math.log1p(-w)) + 1
+                count += 1
+        else:
+            count += sum(1 for _ in rows)
+
+    # Random order, like random.sample (the reservoir starts in file order)
+    rng.shuffle(reservoir)
+
+    # Same dicts as DictReader: missing values are None, extra values dropped
+    records: list[dict[str, str]] = []
+    for row in reservoir:
+        if len(row) < len(header):
+            row = row + [None] * (len(header) - len(row))  # type: ignore[list-item]
+        records.append(dict(zip(header, row)))
+
+    return records, count
 
 
 def save_sample_raw(records: list[dict[str, str]], output_path: Path) -> None:
@@ -51,16 +97,28 @@ def save_sample_raw(records: list[dict[str, str]], output_path: Path) -> None:
     
     fieldnames = list(records[0].keys())
     with open(output_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)  # Uses comma delimiter (default)
-        writer.writeheader()
-        writer.writerows(records)
+        writer = csv.writer(f)  # Uses comma delimiter (default)
+        writer.writerow(fieldnames)
+        writer.writerows([record[name] for name in fieldnames] for record in records)
 
 
 def convert_sample(records: list[dict[str, str]]) -> list[dict[str, Any]]:
-    """Convert ENTU records to MUIS format using orchestrator."""
+    """Convert ENTU records to MUIS format using orchestrator.
+
+    Records are converted column-wise with convert_batch; if that fails,
+    they are converted one by one so the failing records can be reported.
+    """
     converted: list[dict[str, Any]] = []
     errors: list[str] = []
     
+    if records:
+        header = list(records[0].keys())
+        try:
+            return convert_batch(header, [list(record.values()) for record in records])
+        except Exception as e:
+            # Report it: a batch bug would otherwise just look like a slow run
+            print(f"\n⚠️  Batch conversion failed ({type(e).__name__}: {e}), retrying row by row")
+
     for i, record in enumerate(records, 1):
         try:
             result = convert_row(record)
@@ -107,19 +165,15 @@ def main() -> None:
     muis_output = output_dir / f"random_{args.count}_muis.csv"
     
     # Set random seed if provided
+    rng = random.Random(args.seed)
     if args.seed is not None:
-        random.seed(args.seed)
         print(f"🎲 Using random seed: {args.seed}")
     
-    # Load all records
-    print(f"📖 Loading records from {input_path}...")
-    all_records = load_entu_records(input_path)
-    print(f"   Found {len(all_records):,} total records")
-    
-    # Sample random records
-    sample_size = min(args.count, len(all_records))
-    print(f"\n🎯 Selecting {sample_size} random records...")
-    sample = random.sample(all_records, sample_size)
+    # Stream records and sample
+    print(f"📖 Sampling {args.count} random records from {input_path}...")
+    sample, total_records = reservoir_sample(input_path, args.count, rng)
+    print(f"   Found {total_records:,} total records")
+    print(f"\n🎯 Selected {len(sample)} random records")
     
     # Save raw sample
     print(f"💾 Saving raw sample to {raw_output}...")
@@ -16,12 +16,41 @@ Each model includes:
 - Documentation (docstrings)
 """
 
-from pydantic import BaseModel, Field, field_validator, model_validator
-from typing import Optional, List, Literal
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
+from typing import Any, Optional, List, Literal, Tuple
+from dataclasses import dataclass
 from datetime import date as Date, datetime
 from enum import Enum
+import logging
 import re
 
+logger = logging.getLogger(__name__)
+
+# ENTU object code: XXXXXX/XXX
+ENTU_CODE_PATTERN = re.compile(r"^\d{6}/\d{3}$")
+
+
+def _is_estonian_date(v: str) -> bool:
+    """Check for an Estonian event date: aaaa, kk.aaaa or pp.kk.aaaa.
+
+    The three shapes differ in length, so dispatch on len() and check the
+    dot positions and digit runs directly instead of running a regex.
+    """
+    n = len(v)
+    if n == 4:
+        return v.isdecimal()
+    if n == 7:
+        return v[2] == "." and v[:2].isdecimal() and v[3:].isdecimal()
+    if n == 10:
+        return (
+            v[2] == "."
+            and v[5] == "."
+            and v[:2].isdecimal()
+            and v[3:5].isdecimal()
+            and v[6:].isdecimal()
+        )
+    return False
+
 
 # ============================================================================
 # ENUMS & CONSTANTS
@@ -58,6 +87,15 @@ class EventType(str, Enum):
     ACQUISITION = "omandamine"
 
 
+# Common measurement parameters - could be loaded from mapping file
+MEASUREMENT_PARAMETERS = frozenset(
+    {"kõrgus", "laius", "pikkus", "läbimõõt", "sügavus", "kaal", "diameeter"}
+)
+
+# Condition states that require kahjustused (damage description)
+DAMAGED_CONDITIONS = frozenset({Condition.POOR.value, Condition.VERY_POOR.value})
+
+
 # ============================================================================
 # ENTU INPUT MODELS (Source Data)
 # ============================================================================
@@ -140,10 +178,7 @@ class EntuEksponaat(BaseModel):
     @classmethod
     def validate_code_format(cls, v: str) -> str:
         """Ensure code matches expected ENTU format"""
-        import logging
-
-        logger = logging.getLogger(__name__)
-        if v and not re.match(r"^\d{6}/\d{3}$", v):
+        if v and not ENTU_CODE_PATTERN.match(v):
             logger.warning(f"Code format variance: '{v}' (expected XXXXXX/XXX format)")
         return v
 
@@ -157,12 +192,15 @@ class EntuEksponaat(BaseModel):
             return v
         # v must be str at this point
         try:
+            # Fast path for the common zero-padded "YYYY-MM-DD" form
+            if len(v) == 10 and v[4] == v[7] == "-":
+                return Date.fromisoformat(v)
             return datetime.strptime(v, "%Y-%m-%d").date()
         except ValueError:
             return None
 
-    class Config:
-        validate_assignment = True
+    # Built once from a CSV row and never mutated, so no assignment validation
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
 
 
 # ============================================================================
@@ -181,28 +219,25 @@ class MuisMeasurement(BaseModel):
     @classmethod
     def validate_parameter(cls, v: str) -> str:
         """Ensure parameter is valid MUIS vocabulary term"""
-        import logging
-
-        logger = logging.getLogger(__name__)
-        # Common parameters - could be loaded from mapping file
-        valid = ["kõrgus", "laius", "pikkus", "läbimõõt", "sügavus", "kaal", "diameeter"]
-        if v.lower() not in valid:
+        if v.lower() not in MEASUREMENT_PARAMETERS:
             logger.warning(f"Unmapped parameter: '{v}' (not in MUIS vocabulary)")
         return v
 
 
-class MuisMaterial(BaseModel):
+@dataclass(slots=True)
+class MuisMaterial:
     """Material specification with optional comment"""
 
-    materjal: str = Field(..., description="Material name from MUIS vocabulary")
-    kommentaar: Optional[str] = Field(None, description="Additional material details")
+    materjal: str  # Material name from MUIS vocabulary
+    kommentaar: Optional[str] = None  # Additional material details
 
 
-class MuisTechnique(BaseModel):
+@dataclass(slots=True)
+class MuisTechnique:
     """Technique specification with optional comment"""
 
-    tehnika: str = Field(..., description="Technique name from MUIS vocabulary")
-    kommentaar: Optional[str] = Field(None, description="Additional technique details")
+    tehnika: str  # Technique name from MUIS vocabulary
+    kommentaar: Optional[str] = None  # Additional technique details
 
 
 class MuisEvent(BaseModel):
@@ -257,30 +292,165 @@ class MuisEvent(BaseModel):
         if not v:
             return v
         # Accept formats: aaaa, kk.aaaa, pp.kk.aaaa
-        if not re.match(r"^(\d{4}|\d{2}\.\d{4}|\d{2}\.\d{2}\.\d{4})$", v):
+        if not _is_estonian_date(v):
             raise ValueError(f"Invalid date format: {v}. Must be aaaa or kk.aaaa or pp.kk.aaaa")
         return v
 
 
-class MuisDescription(BaseModel):
+@dataclass(slots=True)
+class MuisDescription:
     """Text description with type classification"""
 
-    tyyp: str = Field(..., description="Text type, e.g., 'füüsiline kirjeldus'")
-    tekst: str = Field(..., description="Description text content")
+    tyyp: str  # Text type, e.g., 'füüsiline kirjeldus'
+    tekst: str  # Description text content
 
 
-class MuisAlternativeName(BaseModel):
+@dataclass(slots=True)
+class MuisAlternativeName:
     """Alternative name/title for object"""
 
-    tyyp: str = Field(..., description="Name type")
-    nimetus: str = Field(..., description="Alternative name")
+    tyyp: str  # Name type
+    nimetus: str  # Alternative name
 
 
-class MuisAlternativeNumber(BaseModel):
+@dataclass(slots=True)
+class MuisAlternativeNumber:
     """Alternative number/identifier for object"""
 
-    tyyp: str = Field(..., description="Number type, e.g., 'endine inventarinumber'")
-    number: str = Field(..., description="Alternative number")
+    tyyp: str  # Number type, e.g., 'endine inventarinumber'
+    number: str  # Alternative number
+
+
+# Field names of the repeated MUIS column groups (used by dependency validation)
+MEASUREMENT_FIELDS = tuple(
+    (f"parameeter_{i}", f"yhik_{i}", f"vaartus_{i}") for i in range(1, 5)
+)
+MATERIAL_FIELDS = tuple((f"materjal_{i}", f"materjali_{i}_kommentaar") for i in range(1, 4))
+TECHNIQUE_FIELDS = tuple((f"tehnika_{i}", f"tehnika_{i}_kommentaar") for i in range(1, 4))
+
+
+def _check_museaal_dependencies(fields: dict[str, Any]) -> List[str]:
+    """
+    Check MuisMuseaal conditional field dependencies on a field mapping.
+
+    Shared by the model validator (on the instance __dict__) and by
+    validate_row() (on a raw dict), so both enforce the same rules.
+    Sets riik_1/riik_2 to 'Eesti' in place where required.
+
+    Args:
+        fields: Complete field name -> value mapping
+
+    Returns:
+        Names of the fields that were normalized
+
+    Raises:
+        ValueError: If a dependency rule is violated
+    """
+    normalized: List[str] = []
+
+    # Measurements
+    for i, (parameeter_name, yhik_name, vaartus_name) in enumerate(MEASUREMENT_FIELDS, 1):
+        parameeter = fields[parameeter_name]
+        yhik = fields[yhik_name]
+        vaartus = fields[vaartus_name]
+
+        # If value filled, parameter required
+        if vaartus and not parameeter:
+            raise ValueError(f"parameeter_{i} required when vaartus_{i} is filled")
+
+        # If parameter filled, unit usually required (some exceptions)
+        if parameeter and not yhik:
+            # TODO: Check if this parameter allows missing unit
+            pass
+
+        # If parameter filled, value required
+        if parameeter and not vaartus:
+            raise ValueError(f"vaartus_{i} required when parameeter_{i} is filled")
+
+    # Materials: if comment filled, material required
+    for i, (materjal_name, kommentaar_name) in enumerate(MATERIAL_FIELDS, 1):
+        if fields[kommentaar_name] and not fields[materjal_name]:
+            raise ValueError(f"materjal_{i} required when kommentaar is filled")
+
+    # Techniques: if comment filled, technique required
+    for i, (tehnika_name, kommentaar_name) in enumerate(TECHNIQUE_FIELDS, 1):
+        if fields[kommentaar_name] and not fields[tehnika_name]:
+            raise ValueError(f"tehnika_{i} required when kommentaar is filled")
+
+    # Event 1
+    # If osaleja filled, role required
+    if fields["osaleja_1"] and not fields["osaleja_roll_1"]:
+        raise ValueError("osaleja_roll_1 required when osaleja_1 is filled")
+
+    # If kohanimi filled, selgitus required
+    if (
+        fields["toimumiskoha_tapsustus_kohanimi_1"]
+        and not fields["toimumiskoha_tapsustus_selgitus_1"]
+    ):
+        raise ValueError("selgitus_1 required when kohanimi_1 is filled")
+
+    # If dateering_lopp filled, dateering_algus required
+    if fields["dateeringu_lopp_1"] and not fields["dateering_algus_1"]:
+        raise ValueError("dateering_algus_1 required when dateering_lopp_1 is filled")
+
+    # If admin_yksus or kihelkond filled, riik must be 'Eesti'
+    if (fields["eesti_admin_yksus_1"] or fields["kihelkond_1"]) and fields["riik_1"] != "Eesti":
+        fields["riik_1"] = "Eesti"
+        normalized.append("riik_1")
+
+    # Event 2 (same as Event 1)
+    if fields["osaleja_2"] and not fields["osaleja_roll_2"]:
+        raise ValueError("osaleja_roll_2 required when osaleja_2 is filled")
+
+    if (
+        fields["toimumiskoha_tapsustus_kohanimi_2"]
+        and not fields["toimumiskoha_tapsustus_selgitus_2"]
+    ):
+        raise ValueError("selgitus_2 required when kohanimi_2 is filled")
+
+    if fields["dateeringu_lopp_2"] and not fields["dateering_algus_2"]:
+        raise ValueError("dateering_algus_2 required when dateering_lopp_2 is filled")
+
+    if (fields["eesti_admin_yksus_2"] or fields["kihelkond_2"]) and fields["riik_2"] != "Eesti":
+        fields["riik_2"] = "Eesti"
+        normalized.append("riik_2")
+
+    # Descriptions
+    if fields["teksti_tyyp_1"] and not fields["tekst_1"]:
+        raise ValueError("tekst_1 required when teksti_tyyp_1 is filled")
+    if fields["tekst_1"] and not fields["teksti_tyyp_1"]:
+        raise ValueError("teksti_tyyp_1 required when tekst_1 is filled")
+
+    if fields["teksti_tyyp_2"] and not fields["tekst_2"]:
+        raise ValueError("tekst_2 required when teksti_tyyp_2 is filled")
+    if fields["tekst_2"] and not fields["teksti_tyyp_2"]:
+        raise ValueError("teksti_tyyp_2 required when tekst_2 is filled")
+
+    # Alternative name
+    if fields["nimetuse_tyyp"] and not fields["alt_nimetus"]:
+        raise ValueError("alt_nimetus required when nimetuse_tyyp is filled")
+    if fields["alt_nimetus"] and not fields["nimetuse_tyyp"]:
+        raise ValueError("nimetuse_tyyp required when alt_nimetus is filled")
+
+    # Alternative number
+    if fields["numbri_tyyp"] and not fields["alt_number"]:
+        raise ValueError("alt_number required when numbri_tyyp is filled")
+    if fields["alt_number"] and not fields["numbri_tyyp"]:
+        raise ValueError("numbri_tyyp required when alt_number is filled")
+
+    # If condition is 'halb' or 'väga halb', kahjustused is required
+    if fields["seisund"] in DAMAGED_CONDITIONS and not fields["kahjustused"]:
+        raise ValueError("kahjustused required when seisund is 'halb' or 'väga halb'")
+
+    # If reference value filled, type is required
+    if fields["viite_vaartus"] and not fields["viite_tyyp"]:
+        raise ValueError("viite_tyyp required when viite_vaartus is filled")
+
+    # If leiu_liik filled, leiukontekst is required
+    if fields["leiu_liik"] and not fields["leiukontekst"]:
+        raise ValueError("leiukontekst required when leiu_liik is filled")
+
+    return normalized
 
 
 class MuisMuseaal(BaseModel):
@@ -469,156 +639,89 @@ class MuisMuseaal(BaseModel):
     # ========================================================================
 
     @model_validator(mode="after")
-    def validate_measurement_dependencies(self) -> "MuisMuseaal":
-        """Validate measurement field dependencies"""
-        for i in range(1, 5):
-            parameeter = getattr(self, f"parameeter_{i}")
-            yhik = getattr(self, f"yhik_{i}")
-            vaartus = getattr(self, f"vaartus_{i}")
-
-            # If value filled, parameter required
-            if vaartus and not parameeter:
-                raise ValueError(f"parameeter_{i} required when vaartus_{i} is filled")
-
-            # If parameter filled, unit usually required (some exceptions)
-            if parameeter and not yhik:
-                # TODO: Check if this parameter allows missing unit
-                pass
-
-            # If parameter filled, value required
-            if parameeter and not vaartus:
-                raise ValueError(f"vaartus_{i} required when parameeter_{i} is filled")
-
-        return self
-
-    @model_validator(mode="after")
-    def validate_material_dependencies(self) -> "MuisMuseaal":
-        """Validate material comment dependencies"""
-        for i in range(1, 4):
-            materjal = getattr(self, f"materjal_{i}")
-            kommentaar = getattr(self, f"materjali_{i}_kommentaar")
-
-            # If comment filled, material required
-            if kommentaar and not materjal:
-                raise ValueError(f"materjal_{i} required when kommentaar is filled")
-
-        return self
-
-    @model_validator(mode="after")
-    def validate_technique_dependencies(self) -> "MuisMuseaal":
-        """Validate technique comment dependencies"""
-        for i in range(1, 4):
-            tehnika = getattr(self, f"tehnika_{i}")
-            kommentaar = getattr(self, f"tehnika_{i}_kommentaar")
-
-            # If comment filled, technique required
-            if kommentaar and not tehnika:
-                raise ValueError(f"tehnika_{i} required when kommentaar is filled")
-
-        return self
-
-    @model_validator(mode="after")
-    def validate_event_1_dependencies(self) -> "MuisMuseaal":
-        """Validate Event 1 field dependencies"""
-        # If osaleja filled, role required
-        if self.osaleja_1 and not self.osaleja_roll_1:
-            raise ValueError("osaleja_roll_1 required when osaleja_1 is filled")
-
-        # If kohanimi filled, selgitus required
-        if self.toimumiskoha_tapsustus_kohanimi_1 and not self.toimumiskoha_tapsustus_selgitus_1:
-            raise ValueError("selgitus_1 required when kohanimi_1 is filled")
-
-        # If dateering_lopp filled, dateering_algus required
-        if self.dateeringu_lopp_1 and not self.dateering_algus_1:
-            raise ValueError("dateering_algus_1 required when dateering_lopp_1 is filled")
-
-        # If admin_yksus or kihelkond filled, riik must be 'Eesti'
-        if (self.eesti_admin_yksus_1 or self.kihelkond_1) and self.riik_1 != "Eesti":
-            self.riik_1 = "Eesti"
-
+    def validate_dependencies(self) -> "MuisMuseaal":
+        """Validate conditional field dependencies in a single pass"""
+        # Check the field values in place, without descriptor lookups
+        self.__pydantic_fields_set__.update(_check_museaal_dependencies(self.__dict__))
         return self
 
-    @model_validator(mode="after")
-    def validate_event_2_dependencies(self) -> "MuisMuseaal":
-        """Validate Event 2 field dependencies (same as Event 1)"""
-        if self.osaleja_2 and not self.osaleja_roll_2:
-            raise ValueError("osaleja_roll_2 required when osaleja_2 is filled")
-
-        if self.toimumiskoha_tapsustus_kohanimi_2 and not self.toimumiskoha_tapsustus_selgitus_2:
-            raise ValueError("selgitus_2 required when kohanimi_2 is filled")
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "MuisMuseaal":
+        """
+        Build a MuisMuseaal from already-validated data without validation.
 
-        if self.dateeringu_lopp_2 and not self.dateering_algus_2:
-            raise ValueError("dateering_algus_2 required when dateering_lopp_2 is filled")
+        Uses model_construct(): no type coercion, field validators or
+        dependency checks are run, and field defaults fill missing keys.
+        Only for data produced by this pipeline (e.g., a model_dump() of a
+        validated MuisMuseaal); external input must go through the normal
+        constructor.
 
-        if (self.eesti_admin_yksus_2 or self.kihelkond_2) and self.riik_2 != "Eesti":
-            self.riik_2 = "Eesti"
+        Args:
+            data: Field name -> value mapping
 
-        return self
+        Returns:
+            MuisMuseaal instance
+        """
+        return cls.model_construct(**data)
 
-    @model_validator(mode="after")
-    def validate_description_dependencies(self) -> "MuisMuseaal":
-        """Validate description field dependencies"""
-        # Description 1
-        if self.teksti_tyyp_1 and not self.tekst_1:
-            raise ValueError("tekst_1 required when teksti_tyyp_1 is filled")
-        if self.tekst_1 and not self.teksti_tyyp_1:
-            raise ValueError("teksti_tyyp_1 required when tekst_1 is filled")
-
-        # Description 2
-        if self.teksti_tyyp_2 and not self.tekst_2:
-            raise ValueError("tekst_2 required when teksti_tyyp_2 is filled")
-        if self.tekst_2 and not self.teksti_tyyp_2:
-            raise ValueError("teksti_tyyp_2 required when tekst_2 is filled")
+    @classmethod
+    def validate_many(cls, items: List[dict[str, Any]]) -> List["MuisMuseaal"]:
+        """
+        Validate a batch of records in one pydantic-core call.
 
-        return self
+        Args:
+            items: List of field name -> value mappings
 
-    @model_validator(mode="after")
-    def validate_alternative_name_dependencies(self) -> "MuisMuseaal":
-        """Validate alternative name dependencies"""
-        if self.nimetuse_tyyp and not self.alt_nimetus:
-            raise ValueError("alt_nimetus required when nimetuse_tyyp is filled")
-        if self.alt_nimetus and not self.nimetuse_tyyp:
-            raise ValueError("nimetuse_tyyp required when alt_nimetus is filled")
+        Returns:
+            List of MuisMuseaal instances
 
-        return self
+        Raises:
+            ValidationError: If any record fails validation (errors carry the list index)
+        """
+        return _MUSEAAL_LIST_ADAPTER.validate_python(items)
 
-    @model_validator(mode="after")
-    def validate_alternative_number_dependencies(self) -> "MuisMuseaal":
-        """Validate alternative number dependencies"""
-        if self.numbri_tyyp and not self.alt_number:
-            raise ValueError("alt_number required when numbri_tyyp is filled")
-        if self.alt_number and not self.numbri_tyyp:
-            raise ValueError("numbri_tyyp required when alt_number is filled")
+    @classmethod
+    def validate_row(cls, data: dict[str, Any]) -> "MuisMuseaal":
+        """
+        Build a MuisMuseaal from an already-typed dict, checking only dependencies.
 
-        return self
+        Runs the cross-field dependency rules on the raw dict and hands it to
+        model_construct(), skipping per-field type coercion and constraints.
+        Meant for pipeline output whose values already have the target types.
 
-    @model_validator(mode="after")
-    def validate_condition_damage_dependency(self) -> "MuisMuseaal":
-        """If condition is 'halb' or 'väga halb', kahjustused is required"""
-        if self.seisund in ["halb", "väga halb"] and not self.kahjustused:
-            raise ValueError("kahjustused required when seisund is 'halb' or 'väga halb'")
+        Args:
+            data: Field name -> value mapping (missing optional fields default)
 
-        return self
+        Returns:
+            MuisMuseaal instance
 
-    @model_validator(mode="after")
-    def validate_reference_dependency(self) -> "MuisMuseaal":
-        """If reference value filled, type is required"""
-        if self.viite_vaartus and not self.viite_tyyp:
-            raise ValueError("viite_tyyp required when viite_vaartus is filled")
+        Raises:
+            ValueError: If a required field is missing or a dependency rule is violated
+        """
+        fields = {**_MUSEAAL_DEFAULTS, **data}
+        for name in _MUSEAAL_REQUIRED:
+            if name not in fields:
+                raise ValueError(f"{name} is required")
+        normalized = _check_museaal_dependencies(fields)
+        return cls.model_construct(_fields_set={*data, *normalized}, **fields)
 
-        return self
+    # Export records are never edited after construction: freeze them rather
+    # than re-validating on every attribute assignment
+    model_config = ConfigDict(frozen=True, validate_assignment=False, use_enum_values=True)
 
-    @model_validator(mode="after")
-    def validate_archaeology_dependency(self) -> "MuisMuseaal":
-        """If leiu_liik filled, leiukontekst is required"""
-        if self.leiu_liik and not self.leiukontekst:
-            raise ValueError("leiukontekst required when leiu_liik is filled")
 
-        return self
+# Building the core schema is the expensive part, so do it once
+_MUSEAAL_LIST_ADAPTER = TypeAdapter(List[MuisMuseaal])
 
-    class Config:
-        validate_assignment = True
-        use_enum_values = True
+# Field defaults and required names for MuisMuseaal.validate_row()
+_MUSEAAL_DEFAULTS = {
+    name: field.get_default()
+    for name, field in MuisMuseaal.model_fields.items()
+    if not field.is_required()
+}
+_MUSEAAL_REQUIRED = tuple(
+    name for name, field in MuisMuseaal.model_fields.items() if field.is_required()
+)
 
 
 # ============================================================================
@@ -626,6 +729,313 @@ class MuisMuseaal(BaseModel):
 # ============================================================================
 
 
+# Row 1: Metadata/groupings (simplified - some cells merge in Excel)
+_MUIS_HEADER_ROW_1 = (
+    "",
+    "",
+    "",
+    "Number",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "Nimetus",
+    "Püsiasukoht",
+    "Tulmelegend",
+    "Originaal ?",
+    "Vastuvõtt",
+    "",
+    "",
+    "",
+    "",
+    "Mõõdud",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "Materjal 1",
+    "Materjali 1 kommentaar",
+    "Materjal 2",
+    "Materjali 2 kommentaar",
+    "Materjal 3",
+    "Materjali 3 kommentaar",
+    "Värvus",
+    "Tehnika 1",
+    "Tehnika 1 kommentaar",
+    "Tehnika 2",
+    "Tehnika 2 kommentaar",
+    "Tehnika 3",
+    "Tehnika 3 kommentaar",
+    "Olemus 1",
+    "Olemus 2",
+    "Viited",
+    "",
+    "Arheoloogiline museaal",
+    "",
+    "Arhiiv",
+    "",
+    "Seisund",
+    "Kahjustused",
+    "Museaal sündmuses 1",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "Museaal sündmuses 2",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "Avalik?",
+    "Avalikusta praegused andmed?",
+    "Kirjeldus",
+    "",
+    "",
+    "",
+    "Teised nimetused",
+    "",
+    "Teised numbrid",
+    "",
+)
+
+# Row 2: Column names (Estonian)
+_MUIS_HEADER_ROW_2 = (
+    "museaali_ID",
+    "Importimise staatus",
+    "Kommentaar",
+    "Acr",
+    "Trt",
+    "Trs",
+    "Trj",
+    "Trl",
+    "Kt",
+    "Ks",
+    "Kj",
+    "Kl",
+    "",
+    "",
+    "",
+    "",
+    "Vastuvõtu nr",
+    "Esmane üldinfo",
+    "Kogusse registreerimise aeg",
+    "Üleandja",
+    "Muuseumile omandamise viis",
+    "Parameeter 1",
+    "Ühik 1",
+    "Väärtus 1",
+    "Parameeter 2",
+    "Ühik 2",
+    "Väärtus 2",
+    "Parameeter 3",
+    "Ühik 3",
+    "Väärtus 3",
+    "Parameeter 4",
+    "Ühik 4",
+    "Väärtus 4",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "Viite tüüp",
+    "Väärtus",
+    "Leiukontekst",
+    "Leiu liik",
+    "Pealkirja keel",
+    "Ainese keel",
+    "",
+    "",
+    "Sündmuse liik",
+    "Toimumiskoha täpsustus: kohanimi",
+    "Toimumiskoha täpsustus: selgitus",
+    "Dateering/ dateeringu algus",
+    "On ekr",
+    "Dateeringu lõpp",
+    "Riik",
+    "Eesti admin üksus",
+    "Osaleja",
+    "Osaleja roll",
+    "Kihelkond",
+    "Sündmuse liik",
+    "Toimumiskoha täpsustus: kohanimi",
+    "Toimumiskoha täpsustus: selgitus",
+    "Dateering/ dateeringu algus",
+    "On ekr",
+    "Dateeringu lõpp",
+    "Riik",
+    "Eesti admin üksus",
+    "Osaleja",
+    "Osaleja roll",
+    "Kihelkond",
+    "",
+    "",
+    "Teksti tüüp 1",
+    "Tekst 1",
+    "Teksti tüüp 2",
+    "Tekst 2",
+    "Nimetuse tüüp",
+    "Nimetus",
+    "Numbri tüüp",
+    "Number",
+)
+
+# Row 3: Validation rules (simplified - full text in reference file)
+_MUIS_HEADER_ROW_3 = (
+    "Täidab süsteem",
+    "Täidab süsteem",
+    "Täidab süsteem",
+    "Peab vastama MuISis olevale ACR-ile",
+    "Peab vastama MuISis olevale TRT-le",
+    "Peab olema number",
+    "Peab olema number",
+    "",
+    "Peab vastama MuISis olevale KT-le",
+    "Peab olema number",
+    "Peab olema number",
+    "",
+    (
+        "Peab olema MuISi asukohapuus olemas; "
+        "püsiasukoha järgi täidetakse automaatselt jooksev asukoht"
+    ),
+    "",
+    "",
+    "y (on originaal) või tühi",
+    "",
+    "",
+    "Vastuvõtuakti kinnitamise aeg; Peab olema kujul pp.kk.aaa",
+    "Peab olema MuISis admin osaleja; täidetakse kujul Perekonnanimi, Eesnimi",
+    "",
+    "Kohustuslik, kui on täidetud väärtus",
+    "Enamasti kohustuslik, kui on täidetud parameeter (oleneb parameetrist)",
+    "Peab olema number; kohustuslik, kui on täidetud parameeter",
+    "Kohustuslik, kui on täidetud väärtus",
+    "Enamasti kohustuslik, kui on täidetud parameeter (oleneb parameetrist)",
+    "Peab olema number; kohustuslik, kui on täidetud parameeter",
+    "Kohustuslik, kui on täidetud väärtus",
+    "Enamasti kohustuslik, kui on täidetud parameeter (oleneb parameetrist)",
+    "Peab olema number; kohustuslik, kui on täidetud parameeter",
+    "Kohustuslik, kui on täidetud väärtus",
+    "Enamasti kohustuslik, kui on täidetud parameeter (olenevalt parameetrist)",
+    "Peab olema number; kohustuslik, kui on täidetud parameeter",
+    "Kohustuslik, kui on täidetud materjali kommentaar",
+    "",
+    "Kohustuslik, kui on täidetud materjali kommentaar",
+    "",
+    "Kohustuslik, kui on täidetud materjali kommentaar",
+    "",
+    "",
+    "Kohustuslik, kui on täidetud tehnika kommentaar",
+    "",
+    "Kohustuslik, kui on täidetud tehnika kommentaar",
+    "",
+    "Kohustuslik, kui on täidetud tehnika kommentaar",
+    "",
+    "",
+    "",
+    "Kohustuslik, kui viite väärtus on täidetud",
+    "",
+    "Kohustuslik juhul, kui leiu liik täidetud",
+    "",
+    "",
+    "",
+    "",
+    "",
+    'Kohustuslik, kui seisund on "halb" või "väga halb"',
+    'Kohustuslik, kui on täidetud mõni teine "Museaal sündmuses 1" andmeväljadest',
+    "Kohustuslik, kui toimumiskoha selgitus on täidetud",
+    "Kohustuslik, kui toimumiskoha nimi on täidetud",
+    (
+        "Täidetakse kujul aaaa või kk.aaaa või pp.kk.aaaa; "
+        "Käsitletakse täpse dateeringuna, kui dateeringu lõpp ei ole täidetud"
+    ),
+    "y (on eKr) või tühi (on pKr)",
+    (
+        "Täidetakse, kui dateeringut soovitakse esitada ajavahemikuna; "
+        "Täidetakse kujul aaaa või kk.aaaa või pp.kk.aaaa"
+    ),
+    'Peab olema "Eesti", kui "Eesti admin üksus" või "Kihelkond" on täidetud',
+    "",
+    (
+        "Peab olema MuISis ajalooline osaleja; "
+        "täidetakse kujul Perekonnanimi, Eesnimi VÕI Organisatsiooni nimi (või osaleja ID)"
+    ),
+    "Kohustuslik, kui osaleja on täidetud",
+    "",
+    'Kohustuslik, kui on täidetud mõni teine "Museaal sündmuses 2" andmeväljadest',
+    "Kohustuslik, kui toimumiskoha selgitus on täidetud",
+    "Kohustuslik, kui toimumiskoha nimi on täidetud",
+    (
+        "Täidetakse kujul aaaa või kk.aaaa või pp.kk.aaaa; "
+        "Käsitletakse täpse dateeringuna, kui dateeringu lõpp ei ole täidetud"
+    ),
+    "y (on eKr) või tühi (on pKr)",
+    (
+        "Täidetakse, kui dateeringut soovitakse esitada ajavahemikuna; "
+        "Täidetakse kujul aaaa või kk.aaaa või pp.kk.aaaa"
+    ),
+    'Peab olema "Eesti", kui "Eesti admin üksus" või "Kihelkond" on täidetud',
+    "",
+    (
+        "Peab olema MuISis ajalooline osaleja; "
+        "täidetakse kujul Perekonnanimi, Eesnimi VÕI Organisatsiooni nimi (või osaleja ID)"
+    ),
+    "Kohustuslik, kui osaleja on täidetud",
+    "",
+    "y (on avalik) või tühi",
+    "y (avalikusta praegused andmed) või tühi",
+    'Kohustuslik, kui on täidetud "Tekst 1"',
+    'Kohustuslik, kui on täidetud "Teksti tüüp 1"',
+    'Kohustuslik, kui on täidetud "Tekst 2"',
+    'Kohustuslik, kui on täidetud "Teksti tüüp 2"',
+    'Kohustuslik, kui on täidetud "Nimetus"',
+    'Kohustuslik, kui on täidetud "Nimetuse tüüp"',
+    'Kohustuslik, kui on täidetud "Number"',
+    'Kohustuslik, kui on täidetud "Numbri tüüp"',
+)
+
+# Built once at import; create_muis_header() hands out fresh list copies.
+# The export writer's header is muis_writer.MUIS_HEADER_ROWS.
+_MUIS_HEADER_ROWS: Tuple[Tuple[str, ...], ...] = (
+    _MUIS_HEADER_ROW_1,
+    _MUIS_HEADER_ROW_2,
+    _MUIS_HEADER_ROW_3,
+)
+
+
 def create_muis_header() -> List[List[str]]:
     """
     Generate the 3-row MUIS CSV header structure.
@@ -633,302 +1043,4 @@ def create_muis_header() -> List[List[str]]:
     Returns:
         List of 3 lists representing header rows (metadata, column names, validation rules)
     """
-    # Row 1: Metadata/groupings (simplified - some cells merge in Excel)
-    row_1 = [
-        "",
-        "",
-        "",
-        "Number",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "Nimetus",
-        "Püsiasukoht",
-        "Tulmelegend",
-        "Originaal ?",
-        "Vastuvõtt",
-        "",
-        "",
-        "",
-        "",
-        "Mõõdud",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "Materjal 1",
-        "Materjali 1 kommentaar",
-        "Materjal 2",
-        "Materjali 2 kommentaar",
-        "Materjal 3",
-        "Materjali 3 kommentaar",
-        "Värvus",
-        "Tehnika 1",
-        "Tehnika 1 kommentaar",
-        "Tehnika 2",
-        "Tehnika 2 kommentaar",
-        "Tehnika 3",
-        "Tehnika 3 kommentaar",
-        "Olemus 1",
-        "Olemus 2",
-        "Viited",
-        "",
-        "Arheoloogiline museaal",
-        "",
-        "Arhiiv",
-        "",
-        "Seisund",
-        "Kahjustused",
-        "Museaal sündmuses 1",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "Museaal sündmuses 2",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "Avalik?",
-        "Avalikusta praegused andmed?",
-        "Kirjeldus",
-        "",
-        "",
-        "",
-        "Teised nimetused",
-        "",
-        "Teised numbrid",
-        "",
-    ]
-
-    # Row 2: Column names (Estonian)
-    row_2 = [
-        "museaali_ID",
-        "Importimise staatus",
-        "Kommentaar",
-        "Acr",
-        "Trt",
-        "Trs",
-        "Trj",
-        "Trl",
-        "Kt",
-        "Ks",
-        "Kj",
-        "Kl",
-        "",
-        "",
-        "",
-        "",
-        "Vastuvõtu nr",
-        "Esmane üldinfo",
-        "Kogusse registreerimise aeg",
-        "Üleandja",
-        "Muuseumile omandamise viis",
-        "Parameeter 1",
-        "Ühik 1",
-        "Väärtus 1",
-        "Parameeter 2",
-        "Ühik 2",
-        "Väärtus 2",
-        "Parameeter 3",
-        "Ühik 3",
-        "Väärtus 3",
-        "Parameeter 4",
-        "Ühik 4",
-        "Väärtus 4",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "Viite tüüp",
-        "Väärtus",
-        "Leiukontekst",
-        "Leiu liik",
-        "Pealkirja keel",
-        "Ainese keel",
-        "",
-        "",
-        "Sündmuse liik",
-        "Toimumiskoha täpsustus: kohanimi",
-        "Toimumiskoha täpsustus: selgitus",
-        "Dateering/ dateeringu algus",
-        "On ekr",
-        "Dateeringu lõpp",
-        "Riik",
-        "Eesti admin üksus",
-        "Osaleja",
-        "Osaleja roll",
-        "Kihelkond",
-        "Sündmuse liik",
-        "Toimumiskoha täpsustus: kohanimi",
-        "Toimumiskoha täpsustus: selgitus",
-        "Dateering/ dateeringu algus",
-        "On ekr",
-        "Dateeringu lõpp",
-        "Riik",
-        "Eesti admin üksus",
-        "Osaleja",
-        "Osaleja roll",
-        "Kihelkond",
-        "",
-        "",
-        "Teksti tüüp 1",
-        "Tekst 1",
-        "Teksti tüüp 2",
-        "Tekst 2",
-        "Nimetuse tüüp",
-        "Nimetus",
-        "Numbri tüüp",
-        "Number",
-    ]
-
-    # Row 3: Validation rules (simplified - full text in reference file)
-    row_3 = [
-        "Täidab süsteem",
-        "Täidab süsteem",
-        "Täidab süsteem",
-        "Peab vastama MuISis olevale ACR-ile",
-        "Peab vastama MuISis olevale TRT-le",
-        "Peab olema number",
-        "Peab olema number",
-        "",
-        "Peab vastama MuISis olevale KT-le",
-        "Peab olema number",
-        "Peab olema number",
-        "",
-        (
-            "Peab olema MuISi asukohapuus olemas; "
-            "püsiasukoha järgi täidetakse automaatselt jooksev asukoht"
-        ),
-        "",
-        "",
-        "y (on originaal) või tühi",
-        "",
-        "",
-        "Vastuvõtuakti kinnitamise aeg; Peab olema kujul pp.kk.aaa",
-        "Peab olema MuISis admin osaleja; täidetakse kujul Perekonnanimi, Eesnimi",
-        "",
-        "Kohustuslik, kui on täidetud väärtus",
-        "Enamasti kohustuslik, kui on täidetud parameeter (oleneb parameetrist)",
-        "Peab olema number; kohustuslik, kui on täidetud parameeter",
-        "Kohustuslik, kui on täidetud väärtus",
-        "Enamasti kohustuslik, kui on täidetud parameeter (oleneb parameetrist)",
-        "Peab olema number; kohustuslik, kui on täidetud parameeter",
-        "Kohustuslik, kui on täidetud väärtus",
-        "Enamasti kohustuslik, kui on täidetud parameeter (oleneb parameetrist)",
-        "Peab olema number; kohustuslik, kui on täidetud parameeter",
-        "Kohustuslik, kui on täidetud väärtus",
-        "Enamasti kohustuslik, kui on täidetud parameeter (olenevalt parameetrist)",
-        "Peab olema number; kohustuslik, kui on täidetud parameeter",
-        "Kohustuslik, kui on täidetud materjali kommentaar",
-        "",
-        "Kohustuslik, kui on täidetud materjali kommentaar",
-        "",
-        "Kohustuslik, kui on täidetud materjali kommentaar",
-        "",
-        "",
-        "Kohustuslik, kui on täidetud tehnika kommentaar",
-        "",
-        "Kohustuslik, kui on täidetud tehnika kommentaar",
-        "",
-        "Kohustuslik, kui on täidetud tehnika kommentaar",
-        "",
-        "",
-        "",
-        "Kohustuslik, kui viite väärtus on täidetud",
-        "",
-        "Kohustuslik juhul, kui leiu liik täidetud",
-        "",
-        "",
-        "",
-        "",
-        "",
-        'Kohustuslik, kui seisund on "halb" või "väga halb"',
-        'Kohustuslik, kui on täidetud mõni teine "Museaal sündmuses 1" andmeväljadest',
-        "Kohustuslik, kui toimumiskoha selgitus on täidetud",
-        "Kohustuslik, kui toimumiskoha nimi on täidetud",
-        (
-            "Täidetakse kujul aaaa või kk.aaaa või pp.kk.aaaa; "
-            "Käsitletakse täpse dateeringuna, kui dateeringu lõpp ei ole täidetud"
-        ),
-        "y (on eKr) või tühi (on pKr)",
-        (
-            "Täidetakse, kui dateeringut soovitakse esitada ajavahemikuna; "
-            "Täidetakse kujul aaaa või kk.aaaa või pp.kk.aaaa"
-        ),
-        'Peab olema "Eesti", kui "Eesti admin üksus" või "Kihelkond" on täidetud',
-        "",
-        (
-            "Peab olema MuISis ajalooline osaleja; "
-            "täidetakse kujul Perekonnanimi, Eesnimi VÕI Organisatsiooni nimi (või osaleja ID)"
-        ),
-        "Kohustuslik, kui osaleja on täidetud",
-        "",
-        'Kohustuslik, kui on täidetud mõni teine "Museaal sündmuses 2" andmeväljadest',
-        "Kohustuslik, kui toimumiskoha selgitus on täidetud",
-        "Kohustuslik, kui toimumiskoha nimi on täidetud",
-        (
-            "Täidetakse kujul aaaa või kk.aaaa või pp.kk.aaaa; "
-            "Käsitletakse täpse dateeringuna, kui dateeringu lõpp ei ole täidetud"
-        ),
-        "y (on eKr) või tühi (on pKr)",
-        (
-            "Täidetakse, kui dateeringut soovitakse esitada ajavahemikuna; "
-            "Täidetakse kujul aaaa või kk.aaaa või pp.kk.aaaa"
-        ),
-        'Peab olema "Eesti", kui "Eesti admin üksus" või "Kihelkond" on täidetud',
-        "",
-        (
-            "Peab olema MuISis ajalooline osaleja; "
-            "täidetakse kujul Perekonnanimi, Eesnimi VÕI Organisatsiooni nimi (või osaleja ID)"
-        ),
-        "Kohustuslik, kui osaleja on täidetud",
-        "",
-        "y (on avalik) või tühi",
-        "y (avalikusta praegused andmed) või tühi",
-        'Kohustuslik, kui on täidetud "Tekst 1"',
-        'Kohustuslik, kui on täidetud "Teksti tüüp 1"',
-        'Kohustuslik, kui on täidetud "Tekst 2"',
-        'Kohustuslik, kui on täidetud "Teksti tüüp 2"',
-        'Kohustuslik, kui on täidetud "Nimetus"',
-        'Kohustuslik, kui on täidetud "Nimetuse tüüp"',
-        'Kohustuslik, kui on täidetud "Number"',
-        'Kohustuslik, kui on täidetud "Numbri tüüp"',
-    ]
-
-    return [row_1, row_2, row_3]
+    return [list(row) for row in _MUIS_HEADER_ROWS]
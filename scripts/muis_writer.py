@@ -14,15 +14,19 @@ Handles:
 """
 
 import csv
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional
+
+from scripts.csv_to_excel import column_widths, rows_to_excel
 
 
 # ============================================================================
 # MUIS HEADER DEFINITIONS
 # ============================================================================
 
-MUIS_COLUMN_NAMES = [
+# Output column order, fixed at import (row 2 of the header)
+MUIS_COLUMN_NAMES = (
     # System columns (1-3)
     "museaali_ID",
     "Importimise staatus",
@@ -133,9 +137,9 @@ MUIS_COLUMN_NAMES = [
     # Legend columns (90-91) - Issue #14
     "Avalik legend",
     "Mitteavaliku legend",
-]
+)
 
-MUIS_VALIDATION_RULES = [
+MUIS_VALIDATION_RULES = (
     # System columns (1-3)
     "Täidab süsteem",
     "Täidab süsteem",
@@ -246,7 +250,77 @@ MUIS_VALIDATION_RULES = [
     # Legend columns (90-91)
     "",
     "",
-]
+)
+
+# Metadata, column names and validation rules rows, built once
+MUIS_HEADER_ROWS = (
+    tuple(
+        "Tabel uuendatud konversiooni teel" if col == "Kommentaar" else ""
+        for col in MUIS_COLUMN_NAMES
+    ),
+    MUIS_COLUMN_NAMES,
+    MUIS_VALIDATION_RULES,
+)
+
+# Output buffer for MUIS CSV files; exports run to tens of thousands of rows
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Column name -> position in a MUIS row
+_FIELD_INDEX = {name: i for i, name in enumerate(MUIS_COLUMN_NAMES)}
+
+# Static cell defaults: flag columns are "" (not set), everything else empty
+_DEFAULT_ROW = tuple(
+    ""
+    if name in ("Originaal ?", "On eKr 1", "On eKr 2", "Avalik", "Avalikusta praegused andmed")
+    else None
+    for name in MUIS_COLUMN_NAMES
+)
+
+# MUIS column -> orchestrator key for cells copied over as-is
+_DIRECT_FIELDS = (
+    # Number structure (4-12) - from number parser
+    ("Acr", "acr"),
+    ("Trt", "trt"),
+    ("Trs", "trs"),
+    ("Trj", "trj"),
+    ("Trl", "trl"),
+    ("Kt", "kt"),
+    ("Ks", "ks"),
+    ("Kj", "kj"),
+    ("Kl", "kl"),
+    # Req 2: Column M (Nimetus) ← description (per Vabamu: R content → M)
+    ("Nimetus", "description"),
+    # Req 8: Column N (Püsiasukoht) ← asukoht
+    ("Püsiasukoht", "asukoht"),
+    ("Tulmelegend", "description"),
+    # Req 3a: Column Q (Vastuvõtu nr) ← vastuv6tuakt
+    ("Vastuvõtu nr", "vastuvotuakt"),
+    ("Esmane üldinfo", "description"),
+    # Req 3b: Column S (Kogusse registreerimise aeg) ← date (DD.MM.YYYY)
+    ("Koguse registreerimise aeg", "date"),
+    ("Üleandja", "donator"),
+    ("Värvus", "color"),
+    ("Tekst 1", "description"),
+    # Req 7: Column CJ (Alt number) ← code (original ENTU code)
+    ("Alt number", "code_original"),
+    # Issue #11: Dateering ← year (free text, e.g. "1980", "1950-ndad", "1940-1945")
+    ("Dateering", "year"),
+    # Issue #14: public legend (visible to public) and internal legend
+    ("Avalik legend", "public_legend"),
+    ("Mitteavaliku legend", "legend"),
+)
+_DIRECT_INDICES = tuple(_FIELD_INDEX[column] for column, _ in _DIRECT_FIELDS)
+_DIRECT_KEYS = tuple(key for _, key in _DIRECT_FIELDS)
+# Fetches all direct cells in one C-level call (convert_row output has every key)
+_direct_values = itemgetter(*_DIRECT_KEYS)
+
+# Parameeter/Ühik/Väärtus positions for measurements 1-4
+_MEASUREMENT_INDICES = tuple(
+    (_FIELD_INDEX[f"Parameeter {i}"], _FIELD_INDEX[f"Ühik {i}"], _FIELD_INDEX[f"Väärtus {i}"])
+    for i in range(1, 5)
+)
+_MATERIAL_INDEX = _FIELD_INDEX["Materjal 1"]
+_TECHNIQUE_INDEX = _FIELD_INDEX["Tehnika 1"]
 
 
 # ============================================================================
@@ -254,6 +328,45 @@ MUIS_VALIDATION_RULES = [
 # ============================================================================
 
 
+def orchestrator_to_muis_values(
+    orchestrator_output: Dict[str, Any],
+) -> List[Any]:
+    """Convert orchestrator dict output to a positional MUIS row.
+
+    Starts from a copy of the static default row and fills in only the
+    cells that come from the orchestrator output.
+
+    Args:
+        orchestrator_output: Dict from convert_row() orchestrator
+
+    Returns:
+        List of cell values in MUIS_COLUMN_NAMES order
+    """
+    row = list(_DEFAULT_ROW)
+    get = orchestrator_output.get
+
+    try:
+        values = _direct_values(orchestrator_output)
+    except KeyError:
+        # Partial dicts (e.g. hand-built in tests): missing keys stay empty
+        values = map(get, _DIRECT_KEYS)
+    for index, value in zip(_DIRECT_INDICES, values):
+        row[index] = value
+
+    # Measurements (22-33) - from dimension parser (up to 4)
+    measurements = get("measurements", [])
+    for (parameeter, yhik, vaartus), m in zip(_MEASUREMENT_INDICES, measurements):
+        row[parameeter] = m.get("parameeter")
+        row[yhik] = m.get("yhik")
+        row[vaartus] = m.get("vaartus")
+
+    # Material and technique (34, 41) - from vocab mapper; comments and 2-3 stay empty
+    row[_MATERIAL_INDEX] = get("material") or None
+    row[_TECHNIQUE_INDEX] = get("technique") or None
+
+    return row
+
+
 def orchestrator_to_muis_row(
     orchestrator_output: Dict[str, Any],
 ) -> Dict[str, Any]:
@@ -263,196 +376,47 @@ def orchestrator_to_muis_row(
         orchestrator_output: Dict from convert_row() orchestrator
 
     Returns:
-        Dict with all 89 MUIS columns (aligned with MUIS_COLUMN_NAMES)
+        Dict with all 91 MUIS columns (aligned with MUIS_COLUMN_NAMES)
     """
-    muis_row: Dict[str, Any] = {}
-
-    # =====================================================================
-    # SYSTEM COLUMNS (1-3) - Leave empty for import system
-    # =====================================================================
-    muis_row["museaali_ID"] = None
-    muis_row["Importimise staatus"] = None
-    muis_row["Kommentaar"] = None
-
-    # =====================================================================
-    # NUMBER STRUCTURE (4-12) - From number parser
-    # =====================================================================
-    muis_row["Acr"] = orchestrator_output.get("acr")
-    muis_row["Trt"] = orchestrator_output.get("trt")
-    muis_row["Trs"] = orchestrator_output.get("trs")
-    muis_row["Trj"] = orchestrator_output.get("trj")
-    muis_row["Trl"] = orchestrator_output.get("trl")
-    muis_row["Kt"] = orchestrator_output.get("kt")
-    muis_row["Ks"] = orchestrator_output.get("ks")
-    muis_row["Kj"] = orchestrator_output.get("kj")
-    muis_row["Kl"] = orchestrator_output.get("kl")
-
-    # =====================================================================
-    # BASIC INFO (13-16)
-    # =====================================================================
-    # Req 2: Column M (Nimetus) ← description (per Vabamu: R content → M)
-    muis_row["Nimetus"] = orchestrator_output.get("description")
-    # Req 8: Column N (Püsiasukoht) ← asukoht
-    muis_row["Püsiasukoht"] = orchestrator_output.get("asukoht")
-    muis_row["Tulmelegend"] = orchestrator_output.get("description")
-    muis_row["Originaal ?"] = ""  # Default empty
+    return dict(zip(MUIS_COLUMN_NAMES, orchestrator_to_muis_values(orchestrator_output)))
 
-    # =====================================================================
-    # ACQUISITION (17-21)
-    # =====================================================================
-    # Req 3a: Column Q (Vastuvõtu nr) ← vastuv6tuakt
-    muis_row["Vastuvõtu nr"] = orchestrator_output.get("vastuvotuakt")
-    muis_row["Esmane üldinfo"] = orchestrator_output.get("description")
-    # Req 3b: Column S (Kogusse registreerimise aeg) ← date (DD.MM.YYYY)
-    muis_row["Koguse registreerimise aeg"] = orchestrator_output.get("date")
-    muis_row["Üleandja"] = orchestrator_output.get("donator")
-    muis_row["Muuseumile omandamise viis"] = None  # TODO: From paid field
-
-    # =====================================================================
-    # MEASUREMENTS (22-33) - From dimension parser (up to 4)
-    # =====================================================================
-    measurements = orchestrator_output.get("measurements", [])
-    for i in range(1, 5):
-        if i - 1 < len(measurements):
-            m = measurements[i - 1]
-            muis_row[f"Parameeter {i}"] = m.get("parameeter")
-            muis_row[f"Ühik {i}"] = m.get("yhik")
-            muis_row[f"Väärtus {i}"] = m.get("vaartus")
-        else:
-            muis_row[f"Parameeter {i}"] = None
-            muis_row[f"Ühik {i}"] = None
-            muis_row[f"Väärtus {i}"] = None
-
-    # =====================================================================
-    # MATERIALS (34-40) - From vocab mapper (up to 3)
-    # =====================================================================
-    material = orchestrator_output.get("material")
-    muis_row["Materjal 1"] = material if material else None
-    muis_row["Materjali 1 kommentaar"] = None
-    muis_row["Materjal 2"] = None
-    muis_row["Materjali 2 kommentaar"] = None
-    muis_row["Materjal 3"] = None
-    muis_row["Materjali 3 kommentaar"] = None
-    muis_row["Värvus"] = orchestrator_output.get("color")
-
-    # =====================================================================
-    # TECHNIQUES (41-47) - From vocab mapper (up to 3)
-    # =====================================================================
-    technique = orchestrator_output.get("technique")
-    muis_row["Tehnika 1"] = technique if technique else None
-    muis_row["Tehnika 1 kommentaar"] = None
-    muis_row["Tehnika 2"] = None
-    muis_row["Tehnika 2 kommentaar"] = None
-    muis_row["Tehnika 3"] = None
-    muis_row["Tehnika 3 kommentaar"] = None
-
-    # =====================================================================
-    # NATURE/TYPE (48-49)
-    # =====================================================================
-    muis_row["Olemus 1"] = None
-    muis_row["Olemus 2"] = None
-
-    # =====================================================================
-    # REFERENCES (50-51)
-    # =====================================================================
-    muis_row["Viite tyyp"] = None
-    muis_row["Viite väärtus"] = None
-
-    # =====================================================================
-    # ARCHAEOLOGY (52-55)
-    # =====================================================================
-    muis_row["Leiukontekst"] = None
-    muis_row["Leiu liik"] = None
-    muis_row["Pealkirja keel"] = None
-    muis_row["Ainese keel"] = None
-
-    # =====================================================================
-    # CONDITION (56-57)
-    # =====================================================================
-    muis_row["Seisund"] = None
-    muis_row["Kahjustused"] = None
-
-    # =====================================================================
-    # EVENT 1 (58-68) - Optional, leave empty for now
-    # =====================================================================
-    muis_row["Sündmuse liik 1"] = None
-    muis_row["Toimumiskoha tapsustus kohanimi 1"] = None
-    muis_row["Toimumiskoha tapsustus selgitus 1"] = None
-    muis_row["Dateering algus 1"] = None
-    muis_row["On eKr 1"] = ""
-    muis_row["Dateeringu lopp 1"] = None
-    muis_row["Riik 1"] = None
-    muis_row["Eesti admin yksus 1"] = None
-    muis_row["Osaleja 1"] = None
-    muis_row["Osaleja roll 1"] = None
-    muis_row["Kihelkond 1"] = None
-
-    # =====================================================================
-    # EVENT 2 (69-79) - Optional, leave empty for now
-    # =====================================================================
-    muis_row["Sündmuse liik 2"] = None
-    muis_row["Toimumiskoha tapsustus kohanimi 2"] = None
-    muis_row["Toimumiskoha tapsustus selgitus 2"] = None
-    muis_row["Dateering algus 2"] = None
-    muis_row["On eKr 2"] = ""
-    muis_row["Dateeringu lopp 2"] = None
-    muis_row["Riik 2"] = None
-    muis_row["Eesti admin yksus 2"] = None
-    muis_row["Osaleja 2"] = None
-    muis_row["Osaleja roll 2"] = None
-    muis_row["Kihelkond 2"] = None
-
-    # =====================================================================
-    # VISIBILITY (80-81)
-    # =====================================================================
-    muis_row["Avalik"] = ""  # Default not public
-    muis_row["Avalikusta praegused andmed"] = ""
-
-    # =====================================================================
-    # DESCRIPTIONS (82-85) - Up to 2 descriptions
-    # =====================================================================
-    muis_row["Teksti tyyp 1"] = None
-    muis_row["Tekst 1"] = orchestrator_output.get("description")
-    muis_row["Teksti tyyp 2"] = None
-    muis_row["Tekst 2"] = None
-
-    # =====================================================================
-    # ALTERNATIVE NAMES (86-87)
-    # =====================================================================
-    muis_row["Nimetuse tyyp"] = None
-    muis_row["Alt nimetus"] = None
-
-    # =====================================================================
-    # ALTERNATIVE NUMBERS (88-89)
-    # Req 7: Column CJ (Alt number) ← code (original ENTU code)
-    # =====================================================================
-    muis_row["Numbri tyyp"] = None
-    muis_row["Alt number"] = orchestrator_output.get("code_original")
 
-    # =====================================================================
-    # DATEERING (90) - Issue #11
-    # CK column ← year (dating information from ENTU)
-    # Free text format (e.g., "1980", "1950-ndad", "1940-1945")
-    # =====================================================================
-    muis_row["Dateering"] = orchestrator_output.get("year")
+def _excel_value(value: Any) -> Optional[str]:
+    """Format a MUIS cell the way it appears in the CSV export (None stays empty)."""
+    return None if value is None else str(value)
+
+
+def write_muis_excel(
+    orchestrator_outputs: List[Dict[str, Any]],
+    output_path: str | Path,
+) -> Path:
+    """Write list of orchestrator outputs directly to a MUIS Excel file.
+
+    Produces the same sheet as write_muis_csv() followed by csv_to_excel()
+    (3 bold, frozen header rows, auto-width columns, text cells) without
+    the intermediate CSV file.
+
+    Args:
+        orchestrator_outputs: List of dicts from convert_row() orchestrator
+        output_path: Path to write MUIS Excel file
+
+    Returns:
+        Path to created Excel file
+    """
+    rows: List[List[Optional[str]]] = [list(row) for row in MUIS_HEADER_ROWS]
 
-    # =====================================================================
-    # LEGEND FIELDS (90-91) - Issue #14
-    # Avalik legend column ← public_legend (avalik legend - visible to public)
-    # Mitteavaliku legend column ← legend (mitteavaliku legend - internal use only)
-    # Free text format, pass-through from ENTU
-    # =====================================================================
-    muis_row["Avalik legend"] = orchestrator_output.get("public_legend")
-    muis_row["Mitteavaliku legend"] = orchestrator_output.get("legend")
+    for orch_output in orchestrator_outputs:
+        values = orchestrator_to_muis_values(orch_output)
+        rows.append([_excel_value(value) for value in values])
 
-    return muis_row
+    return rows_to_excel(rows, Path(output_path), widths=column_widths(rows))
 
 
 def write_muis_csv(
-    orchestrator_outputs: List[Dict[str, Any]],
+    orchestrator_outputs: Iterable[Dict[str, Any]],
     output_path: str | Path,
 ) -> None:
-    """Write list of orchestrator outputs to MUIS CSV file.
+    """Write orchestrator outputs to MUIS CSV file.
 
     Creates MUIS import format with:
     - Row 1: Metadata (3 system columns + info)
@@ -460,30 +424,23 @@ def write_muis_csv(
     - Row 3: Validation rules
     - Row 4+: Data
 
+    Rows are converted and written as the iterable is consumed, so a
+    generator can be passed to export without holding all records in
+    memory (the 1 MiB file buffer bounds what is held before writing).
+
     Args:
-        orchestrator_outputs: List of dicts from convert_row() orchestrator
+        orchestrator_outputs: Dicts from convert_row() orchestrator (any iterable)
         output_path: Path to write MUIS CSV file
 
     Encoding: UTF-8
     """
     output_path = Path(output_path)
 
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=MUIS_COLUMN_NAMES)
-
-        # Write metadata row (mostly empty, system-filled)
-        metadata_row = {col: "" for col in MUIS_COLUMN_NAMES}
-        metadata_row["Kommentaar"] = "Tabel uuendatud konversiooni teel"
-        writer.writerow(metadata_row)
-
-        # Write column names row
-        writer.writerow({col: col for col in MUIS_COLUMN_NAMES})
+    with open(output_path, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
 
-        # Write validation rules row
-        validation_row = {col: rule for col, rule in zip(MUIS_COLUMN_NAMES, MUIS_VALIDATION_RULES)}
-        writer.writerow(validation_row)
+        # Write metadata, column names and validation rules rows
+        writer.writerows(MUIS_HEADER_ROWS)
 
         # Write data rows
-        for orch_output in orchestrator_outputs:
-            muis_row = orchestrator_to_muis_row(orch_output)
-            writer.writerow(muis_row)
+        writer.writerows(map(orchestrator_to_muis_values, orchestrator_outputs))
@@ -19,17 +19,24 @@ class VocabularyEntry(TypedDict):
     parent_id: str
 
 
+# Vocabulary name -> first of its 3 columns (term_et, term_id, parent_id)
+VOCABULARY_COLUMNS = (
+    ('acquisition_methods', 0),   # Omandamise viis (columns 0-2)
+    ('measurement_types', 3),     # Mõõt/Mõõtmed (columns 3-5)
+    ('measurement_units', 6),     # Mõõtühikud (columns 6-8)
+    ('formats', 9),               # Formaadid (columns 9-11)
+    ('colors', 12),               # Värv (columns 12-14)
+    ('patterns', 15),             # Muster (columns 15-17)
+    ('techniques', 18),           # Tehnika (columns 18-20)
+)
+VOCABULARY_ROW_WIDTH = 3 * len(VOCABULARY_COLUMNS)
+
+
 def parse_loendid1_csv(csv_path: str) -> dict[str, list[VocabularyEntry]]:
     """Parse Loendid 1 CSV with multiple vocabulary columns."""
 
     vocabularies: dict[str, list[VocabularyEntry]] = {
-        'acquisition_methods': [],  # Omandamise viis (columns 0-2)
-        'measurement_types': [],    # Mõõt/Mõõtmed (columns 3-5)
-        'measurement_units': [],    # Mõõtühikud (columns 6-8)
-        'formats': [],              # Formaadid (columns 9-11)
-        'colors': [],               # Värv (columns 12-14)
-        'patterns': [],             # Muster (columns 15-17)
-        'techniques': [],           # Tehnika (columns 18-20)
+        name: [] for name, _ in VOCABULARY_COLUMNS
     }
     
     with open(csv_path, 'r', encoding='utf-8') as f:
@@ -39,62 +46,19 @@ def parse_loendid1_csv(csv_path: str) -> dict[str, list[VocabularyEntry]]:
             if not row or not any(row):  # Skip empty rows
                 continue
             
-            # Parse each vocabulary column group (3 columns each)
-            # Column group 0-2: Omandamise viis
-            if len(row) > 0 and row[0].strip():
-                vocabularies['acquisition_methods'].append({
-                    'term_et': row[0].strip(),
-                    'term_id': row[1].strip() if len(row) > 1 else '',
-                    'parent_id': row[2].strip() if len(row) > 2 else ''
-                })
-            
-            # Column group 3-5: Mõõt types
-            if len(row) > 3 and row[3].strip():
-                vocabularies['measurement_types'].append({
-                    'term_et': row[3].strip(),
-                    'term_id': row[4].strip() if len(row) > 4 else '',
-                    'parent_id': row[5].strip() if len(row) > 5 else ''
-                })
-            
-            # Column group 6-8: Mõõtühikud
-            if len(row) > 6 and row[6].strip():
-                vocabularies['measurement_units'].append({
-                    'term_et': row[6].strip(),
-                    'term_id': row[7].strip() if len(row) > 7 else '',
-                    'parent_id': row[8].strip() if len(row) > 8 else ''
-                })
+            # Strip once and pad short rows so every column group is addressable
+            cells = [cell.strip() for cell in row]
+            if len(cells) < VOCABULARY_ROW_WIDTH:
+                cells.extend([''] * (VOCABULARY_ROW_WIDTH - len(cells)))
             
-            # Column group 9-11: Formats
-            if len(row) > 9 and row[9].strip():
-                vocabularies['formats'].append({
-                    'term_et': row[9].strip(),
-                    'term_id': row[10].strip() if len(row) > 10 else '',
-                    'parent_id': row[11].strip() if len(row) > 11 else ''
-                })
-            
-            # Column group 12-14: Värv (Color)
-            if len(row) > 12 and row[12].strip():
-                vocabularies['colors'].append({
-                    'term_et': row[12].strip(),
-                    'term_id': row[13].strip() if len(row) > 13 else '',
-                    'parent_id': row[14].strip() if len(row) > 14 else ''
-                })
-            
-            # Column group 15-17: Muster (Pattern)
-            if len(row) > 15 and row[15].strip():
-                vocabularies['patterns'].append({
-                    'term_et': row[15].strip(),
-                    'term_id': row[16].strip() if len(row) > 16 else '',
-                    'parent_id': row[17].strip() if len(row) > 17 else ''
-                })
-            
-            # Column group 18-20: Tehnika (Technique)
-            if len(row) > 18 and row[18].strip():
-                vocabularies['techniques'].append({
-                    'term_et': row[18].strip(),
-                    'term_id': row[19].strip() if len(row) > 19 else '',
-                    'parent_id': row[20].strip() if len(row) > 20 else ''
-                })
+            # Parse each vocabulary column group (3 columns each)
+            for name, start in VOCABULARY_COLUMNS:
+                if cells[start]:
+                    vocabularies[name].append({
+                        'term_et': cells[start],
+                        'term_id': cells[start + 1],
+                        'parent_id': cells[start + 2]
+                    })
     
     return vocabularies
 
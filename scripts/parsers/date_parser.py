@@ -8,9 +8,22 @@ Example:
     "22.12.2002"
 """
 
+from calendar import isleap
 from datetime import datetime
 from typing import Optional
 
+# Days per month in a non-leap year (February handled separately)
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _is_valid_ymd(year: int, month: int, day: int) -> bool:
+    """Check that year/month/day name a real calendar date."""
+    if not 1 <= month <= 12 or day < 1:
+        return False
+    if month == 2 and isleap(year):
+        return day <= 29
+    return day <= DAYS_IN_MONTH[month - 1]
+
 
 def convert_date(date_str: Optional[str]) -> Optional[str]:
     """
@@ -42,6 +55,20 @@ def convert_date(date_str: Optional[str]) -> Optional[str]:
     if not date_str:
         return None
 
+    # Fast path for the plain "YYYY-MM-DD" form: rearrange by slicing.
+    # Anything else (times, years before 1000, invalid dates) takes the
+    # datetime route below, which decides the result.
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        year, month, day = date_str[:4], date_str[5:7], date_str[8:]
+        digits = year + month + day
+        if (
+            digits.isascii()
+            and digits.isdigit()
+            and year[0] != "0"
+            and _is_valid_ymd(int(year), int(month), int(day))
+        ):
+            return f"{day}.{month}.{year}"
+
     try:
         # Parse ISO format
         dt = datetime.fromisoformat(date_str)
@@ -15,6 +15,11 @@ Example:
 import re
 from typing import Any, Dict, List, Optional
 
+# Diameter: "ø50" or "d50" or "d:50"
+DIAMETER_PATTERN = re.compile(r"[ød][:,]?(\d+(?:\.\d+)?)")
+# HxW or HxWxD: "62x70" or "62x70x80"
+HW_PATTERN = re.compile(r"(\d+(?:\.\d+)?)x(\d+(?:\.\d+)?)(?:x(\d+(?:\.\d+)?))?")
+
 
 def parse_dimensions(dim_str: Optional[str]) -> List[Dict[str, Any]]:
     """
@@ -75,14 +80,41 @@ def parse_dimensions(dim_str: Optional[str]) -> List[Dict[str, Any]]:
         if not part:
             continue
 
+        # Fast path for the common integer-only shapes ("ø50", "d50", "62x70",
+        # "62x70x80"); anything else falls through to the regexes below
+        if part[0] in "ød":
+            digits = part[1:]
+            if digits.isascii() and digits.isdigit():
+                value = float(digits)
+                results.append({"parameeter": "läbimõõt", "yhik": "mm", "vaartus": value})
+                continue
+        else:
+            values = part.split("x")
+            joined = "".join(values)
+            if (
+                2 <= len(values) <= 3
+                and "" not in values
+                and joined.isascii()
+                and joined.isdigit()
+            ):
+                height = float(values[0])
+                width = float(values[1])
+                results.append({"parameeter": "kõrgus", "yhik": "mm", "vaartus": height})
+                results.append({"parameeter": "laius", "yhik": "mm", "vaartus": width})
+                if len(values) == 3:
+                    results.append(
+                        {"parameeter": "sügavus", "yhik": "mm", "vaartus": float(values[2])}
+                    )
+                continue
+
         # Try to parse diameter: "ø50" or "d50" or "d:50"
-        diameter_match = re.search(r"[ød][:,]?(\d+(?:\.\d+)?)", part)
+        diameter_match = DIAMETER_PATTERN.search(part)
         if diameter_match:
             value = float(diameter_match.group(1))
             results.append({"parameeter": "läbimõõt", "yhik": "mm", "vaartus": value})
 
         # Try to parse HxW or HxWxD: "62x70" or "62x70x80"
-        hw_match = re.search(r"(\d+(?:\.\d+)?)x(\d+(?:\.\d+)?)(?:x(\d+(?:\.\d+)?))?", part)
+        hw_match = HW_PATTERN.search(part)
         if hw_match:
             height = float(hw_match.group(1))
             width = float(hw_match.group(2))
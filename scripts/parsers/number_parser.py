@@ -8,7 +8,6 @@ Example:
     {'acr': 'VBM', 'trt': '_', 'trs': 20027, 'trj': 117, ...}
 """
 
-import re
 from typing import Any, Dict
 
 
@@ -51,18 +50,20 @@ def parse_entu_code(code: str) -> Dict[str, Any]:
     # Strip whitespace
     code = code.strip()
 
-    # Pattern: NNNNNN/NNN (6 digits, slash, 3 digits)
-    pattern = r"^(\d{6})/(\d{3})$"
-    match = re.match(pattern, code)
-
-    if not match:
+    # Fixed-width NNNNNN/NNN (6 digits, slash, 3 digits): check by position
+    if (
+        len(code) != 10
+        or code[6] != "/"
+        or not code[:6].isdecimal()
+        or not code[7:].isdecimal()
+    ):
         raise ValueError(
             f"Invalid ENTU code format: '{code}'. Expected format: NNNNNN/NNN (e.g., 020027/117)"
         )
 
     # Parse components
-    series_str = match.group(1)  # e.g., "020027"
-    seq_str = match.group(2)  # e.g., "117"
+    series_str = code[:6]  # e.g., "020027"
+    seq_str = code[7:]  # e.g., "117"
 
     # Convert to integers, stripping leading zeros
     trs = int(series_str)  # 20027 (leading zero stripped)
@@ -12,9 +12,11 @@ Example:
     "Jõgiaas, Miia"  # Already formatted
 """
 
+from functools import lru_cache
 from typing import Optional
 
 
+@lru_cache(maxsize=65536)
 def map_person(person_id_or_name: Optional[str]) -> Optional[str]:
     """
     Map ENTU person to MUIS format (Phase 1 stub).
@@ -5,11 +5,16 @@ Maps ENTU vocabulary paths to MUIS terms.
 Examples: "/materjalid/metall" → "metall"
 
 Used for materials, techniques, colors, etc.
+
+Mappers are memoized: the same handful of vocabulary paths repeat across
+every row of an export.
 """
 
+from functools import lru_cache
 from typing import Optional
 
 
+@lru_cache(maxsize=65536)
 def map_material(material_path: Optional[str]) -> Optional[str]:
     """
     Map ENTU material path to MUIS material term.
@@ -35,18 +40,14 @@ def map_material(material_path: Optional[str]) -> Optional[str]:
 
     material_path = material_path.strip()
 
-    # If it's a path, extract last component
+    # If it's a path, extract last non-empty component (ignoring trailing slashes)
     if "/" in material_path:
-        parts = material_path.split("/")
-        # Filter out empty parts (from leading/trailing slashes)
-        parts = [p for p in parts if p]
-        if parts:
-            return parts[-1]
-        return None
+        return material_path.rstrip("/").rpartition("/")[2] or None
 
     return material_path if material_path else None
 
 
+@lru_cache(maxsize=65536)
 def map_technique(technique_path: Optional[str]) -> Optional[str]:
     """
     Map ENTU technique to MUIS term.
@@ -62,6 +63,7 @@ def map_technique(technique_path: Optional[str]) -> Optional[str]:
     return map_material(technique_path)
 
 
+@lru_cache(maxsize=65536)
 def map_color(color_path: Optional[str]) -> Optional[str]:
     """
     Map ENTU color to MUIS term.
@@ -19,45 +19,92 @@ from scripts.convert_row import convert_row
 from scripts.csv_to_excel import csv_to_excel
 from scripts.muis_writer import write_muis_csv
 
+# Read buffer for the sequential eksponaat.csv scan (default is 8 KiB)
+READ_BUFFER_SIZE = 1 << 20
 
-def process_collection(collection_name: str, output_dir: Path) -> None:
-    """Process a single collection."""
+
+def scan_collections(input_file: Path, collection_names: list[str]) -> dict[str, dict[str, Any]]:
+    """Read the ENTU export once, converting rows of the requested collections as they stream by.
+
+    Returns:
+        Dict mapping collection name -> {"records": matched row count,
+        "converted": converted rows, "errors": conversion error count,
+        "public_legends"/"legends": converted rows with that legend set}
+    """
+    wanted = frozenset(collection_names)
+    results: dict[str, dict[str, Any]] = {
+        name: {"records": 0, "converted": [], "errors": 0, "public_legends": 0, "legends": 0}
+        for name in wanted
+    }
+
+    with open(input_file, "r", encoding="utf-8", buffering=READ_BUFFER_SIZE) as f:
+        reader = csv.reader(f)
+        header = tuple(next(reader, ()))
+        if "kuuluvus" not in header:
+            raise ValueError(f"Input file has no 'kuuluvus' column: {input_file}")
+        kuuluvus_idx = header.index("kuuluvus")
+        width = len(header)
+
+        # Raw kuuluvus value -> requested collection name or None (few distinct values)
+        matches: dict[str, str | None] = {}
+
+        # Filter on the raw row; only matching rows are turned into dicts.
+        # disable=None turns the bar off when output is not a terminal
+        progress = tqdm(
+            reader, desc="Reading and converting", unit=" records", disable=None, mininterval=0.5
+        )
+        for row in progress:
+            if len(row) <= kuuluvus_idx:
+                continue
+            raw_kuuluvus = row[kuuluvus_idx]
+            try:
+                kuuluvus = matches[raw_kuuluvus]
+            except KeyError:
+                stripped = raw_kuuluvus.strip()
+                kuuluvus = matches[raw_kuuluvus] = stripped if stripped in wanted else None
+            if kuuluvus is None:
+                continue
+
+            record = dict(zip(header, row))
+            if len(row) < width:
+                # Same as DictReader: missing trailing fields are None
+                record.update(dict.fromkeys(header[len(row):]))
+
+            result = results[kuuluvus]
+            result["records"] += 1
+            try:
+                converted = convert_row(record)
+                if converted:
+                    result["converted"].append(converted)
+                    # Count legends while the row is at hand
+                    if converted.get("public_legend"):
+                        result["public_legends"] += 1
+                    if converted.get("legend"):
+                        result["legends"] += 1
+            except Exception as e:
+                result["errors"] += 1
+                print(f"Error converting record {record.get('_id')}: {e}")
+
+    return results
+
+
+def process_collection(collection_name: str, result: dict[str, Any], output_dir: Path) -> None:
+    """Write and summarize a single collection scanned by scan_collections()."""
     
     print(f"\n{'='*70}")
     print(f"Processing: {collection_name}")
     print(f"{'='*70}")
     
-    # Read all records
-    input_file = Path("entust/eksponaat.csv")
-    records: list[dict[str, Any]] = []
-    
-    with open(input_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in tqdm(reader, desc=f"Reading {collection_name}", unit=" records"):
-            kuuluvus = row.get("kuuluvus", "").strip()
-            if kuuluvus == collection_name:
-                records.append(row)
-    
-    if not records:
+    record_count = result["records"]
+    if not record_count:
         print(f"⚠️  No records found for collection: {collection_name}")
         return
     
-    print(f"Found {len(records):,} records")
+    print(f"Found {record_count:,} records")
     
-    # Convert records
-    converted_rows: list[dict[str, Any]] = []
-    success_count = 0
-    error_count = 0
-    
-    for row in tqdm(records, desc="Converting", unit=" records"):
-        try:
-            converted = convert_row(row)
-            if converted:
-                converted_rows.append(converted)
-                success_count += 1
-        except Exception as e:
-            error_count += 1
-            print(f"Error converting record {row.get('_id')}: {e}")
+    converted_rows: list[dict[str, Any]] = result["converted"]
+    success_count = len(converted_rows)
+    error_count = result["errors"]
     
     # Write CSV
     sanitized_name = collection_name.replace(" ", "_").replace("/", "_")
@@ -72,18 +119,18 @@ def process_collection(collection_name: str, output_dir: Path) -> None:
     
     # Summary
     print(f"\nSummary:")
-    print(f"  Total records: {len(records):,}")
-    print(f"  Successfully converted: {success_count:,} ({success_count/len(records)*100:.1f}%)")
+    print(f"  Total records: {record_count:,}")
+    print(f"  Successfully converted: {success_count:,} ({success_count/record_count*100:.1f}%)")
     print(f"  Errors: {error_count:,}")
     
-    # Check legend fields
-    public_legend_count = sum(1 for r in converted_rows if r.get("public_legend"))
-    legend_count = sum(1 for r in converted_rows if r.get("legend"))
+    # Check legend fields (counted during the scan)
+    public_legend_count = result["public_legends"]
+    legend_count = result["legends"]
     
     if public_legend_count > 0 or legend_count > 0:
         print(f"\n  Legend fields:")
-        print(f"    Public legends: {public_legend_count:,} ({public_legend_count/len(records)*100:.1f}%)")
-        print(f"    Internal legends: {legend_count:,} ({legend_count/len(records)*100:.1f}%)")
+        print(f"    Public legends: {public_legend_count:,} ({public_legend_count/record_count*100:.1f}%)")
+        print(f"    Internal legends: {legend_count:,} ({legend_count/record_count*100:.1f}%)")
 
 
 def main() -> int:
@@ -100,9 +147,17 @@ def main() -> int:
     
     print(f"Output directory: {output_dir.absolute()}")
     
+    # Single pass over the export for all requested collections
+    input_file = Path("entust/eksponaat.csv")
+    try:
+        results = scan_collections(input_file, collection_names)
+    except Exception as e:
+        print(f"\n❌ Error reading {input_file}: {e}")
+        return 1
+
     for collection_name in collection_names:
         try:
-            process_collection(collection_name, output_dir)
+            process_collection(collection_name, results[collection_name], output_dir)
         except Exception as e:
             print(f"\n❌ Error processing {collection_name}: {e}")
             import traceback
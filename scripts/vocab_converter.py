@@ -35,9 +35,8 @@ Error handling:
 """
 
 from pathlib import Path
-from typing import Type, Union
-import json
-from pydantic import ValidationError
+from typing import Any, Type, Union
+from pydantic import TypeAdapter
 
 from scripts.vocab_models import (
     VocabularyEntry1,
@@ -47,6 +46,24 @@ from scripts.vocab_models import (
     VocabularyMetadata,
 )
 
+# Read buffer for vocabulary files (default 8 KiB means many small reads)
+READ_BUFFER_SIZE = 1 << 20
+
+# Entry fields in TSV column order (an N-column file fills the first N)
+ENTRY_FIELD_NAMES = ("term", "term_id", "parent_id", "muis_id")
+
+# Column count -> adapter that serializes a whole entry list in one call
+ENTRY_LIST_ADAPTERS: dict[int, TypeAdapter[Any]] = {
+    1: TypeAdapter(list[VocabularyEntry1]),
+    2: TypeAdapter(list[VocabularyEntry2]),
+    3: TypeAdapter(list[VocabularyEntry3]),
+    4: TypeAdapter(list[VocabularyEntry4]),
+}
+
+# pydantic-core JSON encoder: same bytes as json.dump(ensure_ascii=False,
+# indent=2), without the pure-Python encoder
+OUTPUT_ADAPTER: TypeAdapter[dict[str, object]] = TypeAdapter(dict[str, object])
+
 
 def detect_column_count(input_file: Path) -> int:
     """
@@ -75,7 +92,7 @@ def detect_column_count(input_file: Path) -> int:
         )
 
     try:
-        with open(input_file, "r", encoding="utf-8") as f:
+        with open(input_file, "r", encoding="utf-8", buffering=READ_BUFFER_SIZE) as f:
             for line in f:
                 line = line.strip()
                 if line:  # Skip empty lines
@@ -161,6 +178,10 @@ def load_vocabulary_from_tsv(
     if column_count not in model_map:
         raise ValueError(f"Invalid column count: {column_count}. Expected 1-4.")
 
+    # Column count is fixed per file: pick model and field names once
+    model_cls = model_map[column_count]
+    field_names = ENTRY_FIELD_NAMES[:column_count]
+
     entries: list[
         Union[
             VocabularyEntry1,
@@ -172,7 +193,7 @@ def load_vocabulary_from_tsv(
     row_num = 0
 
     try:
-        with open(input_file, "r", encoding="utf-8") as f:
+        with open(input_file, "r", encoding="utf-8", buffering=READ_BUFFER_SIZE) as f:
             for line in f:
                 row_num += 1
                 line = line.strip()
@@ -198,39 +219,10 @@ def load_vocabulary_from_tsv(
                         f"Line: {line}"
                     )
 
-                # Create entry with validation
-                try:
-                    if column_count == 1:
-                        entry: Union[
-                            VocabularyEntry1,
-                            VocabularyEntry2,
-                            VocabularyEntry3,
-                            VocabularyEntry4,
-                        ] = VocabularyEntry1(term=parts[0])
-                    elif column_count == 2:
-                        entry = VocabularyEntry2(term=parts[0], term_id=parts[1])
-                    elif column_count == 3:
-                        entry = VocabularyEntry3(
-                            term=parts[0],
-                            term_id=parts[1],
-                            parent_id=parts[2],
-                        )
-                    elif column_count == 4:
-                        entry = VocabularyEntry4(
-                            term=parts[0],
-                            term_id=parts[1],
-                            parent_id=parts[2],
-                            muis_id=parts[3],
-                        )
-                    else:
-                        raise ValueError(f"Unsupported column count: {column_count}")
-
-                    entries.append(entry)
-
-                except ValidationError as e:
-                    raise ValueError(
-                        f"Row {row_num}: Validation failed. {e}. " f"Line: {line}"
-                    ) from e
+                # Checks above already enforce the models' min_length=1,
+                # so build entries without re-running validation
+                values: dict[str, Any] = dict(zip(field_names, parts))
+                entries.append(model_cls.model_construct(**values))
 
     except (IOError, OSError) as e:
         raise FileNotFoundError(f"Error reading file {input_file}: {e}") from e
@@ -345,11 +337,10 @@ class VocabularyConverter:
         # Create output structure
         output_data: dict[str, object] = {
             "_metadata": metadata.model_dump(),
-            vocabulary_name: [entry.model_dump() for entry in entries],
+            vocabulary_name: ENTRY_LIST_ADAPTERS[column_count].dump_python(entries),
         }
 
         # Write JSON output
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
+        output_file.write_bytes(OUTPUT_ADAPTER.dump_json(output_data, indent=2))
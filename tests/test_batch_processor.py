@@ -0,0 +1,236 @@
+"""Tests for the batch processor pipeline.
+
+Runs read_and_group_records -> chunk_bounds -> convert_collection on a
+small ENTU-style CSV:
+- Grouping by kuuluvus (blank lines, empty kuuluvus, duplicate names)
+- Chunk splitting of large collections
+- Excel output for regular collections, CSV for archive collections
+- Worker log forwarding from the process pool
+"""
+
+import csv
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import pytest
+from openpyxl import load_workbook
+from scripts import batch_processor
+from scripts.batch_processor import (
+    ARCHIVE_COLLECTIONS,
+    chunk_bounds,
+    convert_collection,
+    init_worker_logging,
+    load_shard,
+    read_and_group_records,
+    worker_log_forwarding,
+)
+
+
+class ListHandler(logging.Handler):
+    """Collects log records for assertions."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+@pytest.fixture
+def logger() -> logging.Logger:
+    """Logger with no output handlers."""
+    test_logger = logging.getLogger("test_batch_processor")
+    test_logger.handlers = [logging.NullHandler()]
+    return test_logger
+
+
+@pytest.fixture
+def entu_csv(tmp_path: Path) -> Path:
+    """ENTU export: 5 Fotokogu, 1 without kuuluvus, 2 archive records, blank lines."""
+    csv_path = tmp_path / "eksponaat.csv"
+    with open(csv_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["_id", "code", "name", "kuuluvus"])
+        for i in range(1, 6):
+            kuuluvus = "Fotokogu\nFotokogu" if i == 3 else "Fotokogu"
+            writer.writerow([f"f{i}", f"020027/{i:03d}", f"Foto {i}", kuuluvus])
+            f.write("\r\n")  # Blank line between records
+        writer.writerow(["n1", "020028/001", "Ilma koguta", ""])
+        writer.writerow(["m1", "020029/001", "Maha 1", "Maha kantud"])
+        writer.writerow(["m2", "020029/002", "Maha 2", "Maha kantud"])
+    return csv_path
+
+
+class TestReadAndGroupRecords:
+    """Tests for read_and_group_records function."""
+
+    def test_groups_rows_by_collection(
+        self, entu_csv: Path, tmp_path: Path, logger: logging.Logger
+    ) -> None:
+        """Rows should land in one shard per cleaned kuuluvus, blank lines skipped."""
+        shard_dir = tmp_path / "shards"
+        shard_dir.mkdir()
+
+        shards = read_and_group_records(entu_csv, shard_dir, logger)
+
+        counts = {name: len(load_shard(path)[1]) for name, path in shards.items()}
+        assert counts == {"Fotokogu": 5, "(no_collection)": 1, "Maha kantud": 2}
+        header, rows = load_shard(shards["(no_collection)"])
+        assert header == ["_id", "code", "name", "kuuluvus"]
+        assert rows == [["n1", "020028/001", "Ilma koguta", ""]]
+
+    def test_reopened_shards_keep_all_rows(
+        self,
+        entu_csv: Path,
+        tmp_path: Path,
+        logger: logging.Logger,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Closing and reopening shards past the open-file limit should lose nothing."""
+        monkeypatch.setattr(batch_processor, "MAX_OPEN_SHARDS", 1)
+        entu_csv.write_text(
+            entu_csv.read_text(encoding="utf-8") + "f6,020027/006,Foto 6,Fotokogu\r\n",
+            encoding="utf-8",
+        )
+        shard_dir = tmp_path / "shards"
+        shard_dir.mkdir()
+
+        shards = read_and_group_records(entu_csv, shard_dir, logger)
+
+        header, rows = load_shard(shards["Fotokogu"])
+        assert header == ["_id", "code", "name", "kuuluvus"]
+        assert [row[0] for row in rows] == ["f1", "f2", "f3", "f4", "f5", "f6"]
+
+    def test_shard_write_error_aborts(
+        self, entu_csv: Path, tmp_path: Path, logger: logging.Logger
+    ) -> None:
+        """A shard that cannot be opened should raise, not drop the collection."""
+        with pytest.raises(OSError):
+            read_and_group_records(entu_csv, tmp_path / "missing", logger)
+
+
+class TestChunkBounds:
+    """Tests for chunk_bounds function."""
+
+    def test_small_collection_single_chunk(self) -> None:
+        """Collections up to max_rows should not be split."""
+        assert chunk_bounds(5, 5) == [(0, 5)]
+
+    def test_large_collection_split(self) -> None:
+        """Larger collections should split into max_rows chunks with a short tail."""
+        assert chunk_bounds(5, 2) == [(0, 2), (2, 4), (4, 5)]
+
+
+class TestConvertCollection:
+    """End-to-end: grouped shards converted chunk by chunk."""
+
+    def test_pipeline_outputs(self, entu_csv: Path, tmp_path: Path, logger: logging.Logger) -> None:
+        """Each chunk and collection should produce its file with all records."""
+        shard_dir = tmp_path / "shards"
+        shard_dir.mkdir()
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+
+        shards = read_and_group_records(entu_csv, shard_dir, logger)
+        results: dict[str, list[tuple[Path | None, int, int]]] = {}
+        for name, shard_path in shards.items():
+            header, records = load_shard(shard_path)
+            bounds = chunk_bounds(len(records), 2)
+            results[name] = [
+                convert_collection(
+                    name,
+                    header,
+                    records[start:stop],
+                    i if len(bounds) > 1 else None,
+                    len(bounds),
+                    output_dir,
+                    output_format="csv" if name in ARCHIVE_COLLECTIONS else "xlsx",
+                )
+                for i, (start, stop) in enumerate(bounds, start=1)
+            ]
+
+        # Fotokogu: 5 records in 3 Excel chunks of 2, 2 and 1
+        fotokogu = results["Fotokogu"]
+        assert [path.name for path, _, _ in fotokogu if path] == [
+            "vabamu_Fotokogu_1_of_3.xlsx",
+            "vabamu_Fotokogu_2_of_3.xlsx",
+            "vabamu_Fotokogu_3_of_3.xlsx",
+        ]
+        assert [success for _, success, _ in fotokogu] == [2, 2, 1]
+        assert sum(errors for _, _, errors in fotokogu) == 0
+        last_sheet = load_workbook(output_dir / "vabamu_Fotokogu_3_of_3.xlsx").active
+        assert last_sheet is not None
+        assert last_sheet.max_row == 3 + 1  # 3 header rows + 1 record
+
+        # Record without kuuluvus is still converted
+        ((path, success, errors),) = results["(no_collection)"]
+        assert path is not None and path.exists() and path.suffix == ".xlsx"
+        assert (success, errors) == (1, 0)
+
+        # Archive collection: MUIS CSV only
+        ((path, success, errors),) = results["Maha kantud"]
+        assert path == output_dir / "vabamu_Maha_kantud.csv"
+        assert (success, errors) == (2, 0)
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            assert len(list(csv.reader(f))) == 3 + 2
+        assert not (output_dir / "vabamu_Maha_kantud.xlsx").exists()
+        assert not list(output_dir.glob("vabamu_Fotokogu*.csv"))
+
+    def test_batch_failure_logged_before_row_fallback(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """A failing convert_batch should be logged with its error, then rows converted."""
+
+        def failing_batch(header: list[str], rows: list[list[str]]) -> list[dict[str, str]]:
+            raise KeyError("broken column")
+
+        monkeypatch.setattr(batch_processor, "convert_batch", failing_batch)
+        header = ["_id", "code", "name", "kuuluvus"]
+        records = [["f1", "020027/001", "Foto 1", "Fotokogu"]]
+
+        with caplog.at_level(logging.WARNING, logger=batch_processor.LOGGER_NAME):
+            path, success, errors = convert_collection(
+                "Fotokogu", header, records, None, 1, tmp_path
+            )
+
+        assert path is not None and (success, errors) == (1, 0)
+        (record,) = [r for r in caplog.records if "Batch conversion failed" in r.getMessage()]
+        assert "KeyError: 'broken column'" in record.getMessage()
+        assert record.exc_info is not None
+
+
+class TestWorkerLogForwarding:
+    """Worker log records should reach the parent's handlers."""
+
+    def test_spawned_worker_logs_reach_parent(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """convert_collection logging in a spawned worker should be forwarded."""
+        # Spawned workers start without handlers (the macOS/Windows default)
+        spawn = multiprocessing.get_context("spawn")
+        monkeypatch.setattr(batch_processor, "multiprocessing", spawn)
+        handler = ListHandler()
+        parent_logger = logging.getLogger("test_batch_processor.parent")
+        parent_logger.handlers = [handler]
+        parent_logger.propagate = False
+        header = ["_id", "code", "name", "kuuluvus"]
+        records = [["f1", "020027/001", "Foto 1", "Fotokogu"]]
+
+        with worker_log_forwarding(parent_logger) as log_queue, ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=spawn,
+            initializer=init_worker_logging,
+            initargs=(log_queue, logging.INFO),
+        ) as executor:
+            path, success, _ = executor.submit(
+                convert_collection, "Fotokogu", header, records, None, 1, tmp_path
+            ).result()
+
+        assert path is not None and success == 1
+        messages = [record.getMessage() for record in handler.records]
+        assert "Converting Fotokogu: 1 records -> vabamu_Fotokogu.xlsx" in messages
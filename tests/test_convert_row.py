@@ -8,32 +8,51 @@ Tests the complete pipeline that orchestrates all 5 parsers:
 5. Vocab mapper: materials, techniques, colors (path formats)
 """
 
+import copy
 import csv
 import json
 import pytest
 from pathlib import Path
-from typing import Any
-from scripts.convert_row import convert_row
+from types import MappingProxyType
+from typing import Any, Mapping
+from scripts.convert_row import convert_batch, convert_row
 
 
-@pytest.fixture
-def sample_row_0() -> dict[str, Any]:
-    """Load first row from sample_100_raw.csv (photo with code 020027/117)."""
+@pytest.fixture(scope="session")
+def sample_row_0_data() -> Mapping[str, Any]:
+    """Read first row from sample_100_raw.csv once per session (read-only view)."""
     sample_file = Path(__file__).parent.parent / "output" / "sample_100_raw.csv"
     with open(sample_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        return dict(next(reader))
+        reader = csv.reader(f)
+        header = next(reader)
+        return MappingProxyType(dict(zip(header, next(reader))))
 
 
 @pytest.fixture
-def mappings() -> dict[str, Any]:
-    """Load vocabulary mappings."""
+def sample_row_0(sample_row_0_data: Mapping[str, Any]) -> dict[str, Any]:
+    """First row from sample_100_raw.csv (photo with code 020027/117), fresh copy per test."""
+    return dict(sample_row_0_data)
+
+
+@pytest.fixture(scope="session")
+def mappings_data() -> Mapping[str, Any]:
+    """Load vocabulary mappings once per session (read-only view)."""
     mappings_dir = Path(__file__).parent.parent / "mappings"
-    return {
-        "materials": json.loads((mappings_dir / "materials.json").read_text(encoding="utf-8")),
-        "techniques": json.loads((mappings_dir / "techniques.json").read_text(encoding="utf-8")),
-        "colors": json.loads((mappings_dir / "colors.json").read_text(encoding="utf-8")),
-    }
+    return MappingProxyType(
+        {
+            "materials": json.loads((mappings_dir / "materials.json").read_text(encoding="utf-8")),
+            "techniques": json.loads(
+                (mappings_dir / "techniques.json").read_text(encoding="utf-8")
+            ),
+            "colors": json.loads((mappings_dir / "colors.json").read_text(encoding="utf-8")),
+        }
+    )
+
+
+@pytest.fixture
+def mappings(mappings_data: Mapping[str, Any]) -> dict[str, Any]:
+    """Vocabulary mappings, deep copy per test so nested dicts are not shared."""
+    return copy.deepcopy(dict(mappings_data))
 
 
 class TestConvertRowIntegration:
@@ -548,3 +567,30 @@ class TestLegendFields:
 
         assert result.get("public_legend") == "Õpilaste töö (1950-ndad) – väga oluline!"
         assert result.get("legend") == "Märkus: säilitada +4°C juures"
+
+
+class TestConvertBatch:
+    """Test column-wise batch conversion against convert_row."""
+
+    def test_batch_matches_convert_row(self) -> None:
+        """convert_batch should produce the same dicts as convert_row per row."""
+        header = ["code", "dimensions", "date", "donator", "autor", "name", "legend"]
+        rows = [
+            ["006562/001", "ø10", "2002-12-22", "Mari Maasikas", "", "Tass", "Märkus"],
+            ["006562/002", "10x20", "2002-12-22", "Mari Maasikas", "Jaan", "Alus", ""],
+            ["invalid", "", "not a date", "", "", "", ""],
+            ["", "", "", "", "", "", ""],
+        ]
+
+        expected = [convert_row(dict(zip(header, row))) for row in rows]
+
+        assert convert_batch(header, rows) == expected
+
+    def test_batch_missing_columns_and_short_rows(self) -> None:
+        """Missing columns and short rows should behave like absent dict keys."""
+        header = ["code", "name"]
+        rows = [["000001/001", "Nimi"], ["000001/002"]]
+
+        expected = [convert_row(dict(zip(header, row))) for row in rows]
+
+        assert convert_batch(header, rows) == expected
@@ -6,6 +6,8 @@ Tests cover ISO to Estonian date format conversion:
 - Estonian: "22.12.2002"
 """
 
+import pytest
+
 from scripts.parsers.date_parser import convert_date
 
 
@@ -74,3 +76,31 @@ class TestConvertDate:
         """
         result = convert_date("2024-02-29")
         assert result == "29.02.2024"
+
+    def test_century_leap_year(self):
+        """
+        GIVEN: Feb 29 in a year divisible by 400
+        WHEN: convert_date is called
+        THEN: Accepts it as a leap day
+        """
+        assert convert_date("2000-02-29") == "29.02.2000"
+
+    @pytest.mark.parametrize(
+        "date_str",
+        ["1900-02-29", "2023-02-29", "2023-04-31", "2023-13-01", "2023-00-10", "2023-01-00"],
+    )
+    def test_impossible_calendar_date_returns_none(self, date_str):
+        """
+        GIVEN: Well-formed ISO date that is not on the calendar
+        WHEN: convert_date is called
+        THEN: Returns None
+        """
+        assert convert_date(date_str) is None
+
+    def test_leading_zero_year_uses_fallback(self):
+        """
+        GIVEN: Year with a leading zero (outside the fast path)
+        WHEN: convert_date is called
+        THEN: Converts through datetime, year without padding
+        """
+        assert convert_date("0999-01-01") == "01.01.999"
@@ -9,6 +9,7 @@ Tests cover multiple dimension formats:
 - Boundary: Max 4 measurements
 """
 
+import pytest
 from scripts.parsers.dimension_parser import parse_dimensions
 
 
@@ -136,3 +137,52 @@ class TestParseDimensions:
         result = parse_dimensions("H:50 L:60")
         # For now, we don't support this format yet
         assert result == [] or len(result) > 0  # Flexible for future enhancement
+
+
+def _mm(parameeter: str, vaartus: float) -> dict[str, object]:
+    """Expected measurement dict in millimetres."""
+    return {"parameeter": parameeter, "yhik": "mm", "vaartus": vaartus}
+
+
+class TestParseDimensionsFastPath:
+    """Integer shapes take a regex-free path; everything else must fall through."""
+
+    @pytest.mark.parametrize(
+        "dim_str, expected",
+        [
+            ("ø50", [_mm("läbimõõt", 50.0)]),
+            ("d50", [_mm("läbimõõt", 50.0)]),
+            ("62x70", [_mm("kõrgus", 62.0), _mm("laius", 70.0)]),
+            ("62x70x80", [_mm("kõrgus", 62.0), _mm("laius", 70.0), _mm("sügavus", 80.0)]),
+        ],
+    )
+    def test_integer_shapes(self, dim_str: str, expected: list[dict[str, object]]) -> None:
+        """
+        GIVEN: Integer-only diameter or HxW(xD) notation
+        WHEN: parse_dimensions is called
+        THEN: Returns float measurements in order
+        """
+        result = parse_dimensions(dim_str)
+
+        assert result == expected
+        assert all(isinstance(m["vaartus"], float) for m in result)
+
+    @pytest.mark.parametrize(
+        "dim_str, expected",
+        [
+            ("d:50", [_mm("läbimõõt", 50.0)]),
+            ("62.5x70", [_mm("kõrgus", 62.5), _mm("laius", 70.0)]),
+            ("x70", []),
+            ("62xx70", []),
+            ("ø50x60", [_mm("läbimõõt", 50.0), _mm("kõrgus", 50.0), _mm("laius", 60.0)]),
+        ],
+    )
+    def test_fallthrough_to_patterns(
+        self, dim_str: str, expected: list[dict[str, object]]
+    ) -> None:
+        """
+        GIVEN: Notation the fast path does not accept
+        WHEN: parse_dimensions is called
+        THEN: Returns what the diameter/HxW patterns produce
+        """
+        assert parse_dimensions(dim_str) == expected
@@ -4,6 +4,8 @@ import csv
 from pathlib import Path
 import pytest
 from scripts.extract_person_names import (
+    ORG_PATTERN,
+    EntityType,
     classify_entity,
     extract_persons,
     parse_multiline_names,
@@ -31,6 +33,33 @@ class TestClassifyEntity:
         assert classify_entity("Muinsuskaitse AS") == "organization"
         assert classify_entity("Fond SA") == "organization"
 
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "Kala OÜ",
+            "Tallinna Vesi AS",
+            "Kultuurkapital SA",
+            "Kala OÜ Tallinn",
+            "Eesti AS Tartu",
+            "Kultuurkapital SA Tartu",
+        ],
+    )
+    def test_company_suffix_at_end_or_before_space(self, name: str) -> None:
+        """Suffixes OÜ/AS/SA at the end of a name or before a space mark organizations."""
+        assert classify_entity(name) == "organization"
+
+    @pytest.mark.parametrize("name", ["kala oü, tallinn", "vesi as, tartu", "fond sa, tartu"])
+    def test_company_suffix_before_comma(self, name: str) -> None:
+        """Suffix followed by a comma still matches the organization pattern."""
+        assert ORG_PATTERN.search(name)
+
+    @pytest.mark.parametrize(
+        "name", ["Saks", "Jaan Saks", "Saul Tamm", "Asko Lepp", "Tamm Sander", "Oüsi Mari"]
+    )
+    def test_suffix_letters_inside_surname(self, name: str) -> None:
+        """Names merely containing "sa"/"as"/"oü" letters stay persons."""
+        assert classify_entity(name) == "person"
+
     def test_organization_with_institute_keyword(self) -> None:
         """Institute names are organizations."""
         assert classify_entity("Eesti Instituut") == "organization"
@@ -41,6 +70,13 @@ class TestClassifyEntity:
         assert classify_entity("Unknown Entity") == "person"
         assert classify_entity("John Smith") == "person"
 
+    def test_returns_entity_type_as_plain_string(self) -> None:
+        """EntityType members compare and format as their string values."""
+        assert classify_entity("Tamm, Jaan") is EntityType.PERSON
+        assert classify_entity("Eesti Rahva Muuseum") is EntityType.ORGANIZATION
+        assert str(EntityType.PERSON) == "person"
+        assert f"{EntityType.ORGANIZATION}" == "organization"
+
 
 class TestParseMultilineNames:
     """Test parsing of multiline name fields."""
@@ -157,6 +193,22 @@ class TestExtractPersons:
         )
         assert museum_record["entity_type"] == "organization"
 
+    def test_entity_type_written_as_plain_string(
+        self, sample_csv: Path, tmp_path: Path
+    ) -> None:
+        """Registry CSV should hold "person"/"organization", not enum reprs."""
+        output_path = tmp_path / "registry.csv"
+
+        write_registry_request(extract_persons(sample_csv), output_path)
+
+        with open(output_path, "r", encoding="utf-8") as f:
+            types = {row["entu_value"]: row["entity_type"] for row in csv.DictReader(f)}
+        assert types == {
+            "Tamm, Jaan": "person",
+            "Kask, Mari": "person",
+            "Eesti Rahva Muuseum": "organization",
+        }
+
     def test_sample_records_included(self, sample_csv: Path) -> None:
         """Sample record IDs are included."""
         results = extract_persons(sample_csv)
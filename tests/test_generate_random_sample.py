@@ -0,0 +1,105 @@
+"""Tests for random sample generation.
+
+Tests reservoir sampling of ENTU CSV rows:
+- Sample size and total count
+- k == 0 and k >= number of rows
+- DictReader-compatible records (short rows padded, blank lines skipped)
+- Row-by-row fallback when batch conversion fails
+"""
+
+import random
+import pytest
+from pathlib import Path
+from typing import Any
+from scripts import generate_random_sample
+from scripts.generate_random_sample import convert_sample, reservoir_sample
+
+
+@pytest.fixture
+def entu_csv(tmp_path: Path) -> Path:
+    """ENTU-style CSV with 50 records."""
+    csv_file = tmp_path / "eksponaat.csv"
+    lines = ["_id,code,name"] + [f"id{i},{i:06d}/001,Objekt {i}" for i in range(50)]
+    csv_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return csv_file
+
+
+class TestReservoirSample:
+    """Tests for reservoir_sample function."""
+
+    @pytest.mark.parametrize("k", [1, 10, 49])
+    def test_sample_size_and_count(self, entu_csv: Path, k: int) -> None:
+        """Should return k distinct records and the total record count."""
+        records, count = reservoir_sample(entu_csv, k, random.Random(42))
+
+        assert count == 50
+        assert len(records) == k
+        assert len({r["_id"] for r in records}) == k
+        assert all(r["name"] == f"Objekt {r['_id'][2:]}" for r in records)
+
+    @pytest.mark.parametrize("k", [50, 100])
+    def test_k_at_least_rows_returns_all(self, entu_csv: Path, k: int) -> None:
+        """Should return every record when k covers the whole file."""
+        records, count = reservoir_sample(entu_csv, k, random.Random(42))
+
+        assert count == 50
+        assert sorted(r["_id"] for r in records) == sorted(f"id{i}" for i in range(50))
+
+    def test_k_zero_returns_nothing(self, entu_csv: Path) -> None:
+        """Should return no records but still count them."""
+        records, count = reservoir_sample(entu_csv, 0, random.Random(42))
+
+        assert records == []
+        assert count == 50
+
+    def test_seeded_sample_is_reproducible(self, entu_csv: Path) -> None:
+        """Same seed should give the same sample."""
+        first, _ = reservoir_sample(entu_csv, 10, random.Random(7))
+        second, _ = reservoir_sample(entu_csv, 10, random.Random(7))
+
+        assert first == second
+
+    def test_short_row_padded_with_none(self, tmp_path: Path) -> None:
+        """Missing trailing values should be None, as with csv.DictReader."""
+        csv_file = tmp_path / "short.csv"
+        csv_file.write_text("_id,code,name\nid0,000001/001\n", encoding="utf-8")
+
+        records, count = reservoir_sample(csv_file, 5, random.Random(42))
+
+        assert count == 1
+        assert records == [{"_id": "id0", "code": "000001/001", "name": None}]
+
+    @pytest.mark.parametrize("k", [0, 2, 5])
+    def test_blank_lines_skipped(self, tmp_path: Path, k: int) -> None:
+        """Blank lines should be neither counted nor sampled."""
+        csv_file = tmp_path / "blank.csv"
+        csv_file.write_text(
+            "_id,code,name\n\nid0,000001/001,A\n\nid1,000002/001,B\n\n", encoding="utf-8"
+        )
+
+        records, count = reservoir_sample(csv_file, k, random.Random(42))
+
+        assert count == 2
+        assert len(records) == min(k, 2)
+        assert all(r["_id"] in ("id0", "id1") for r in records)
+
+
+class TestConvertSample:
+    """Tests for convert_sample function."""
+
+    def test_batch_failure_reported_before_fallback(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """A failing batch should be reported, then rows converted one by one."""
+
+        def failing_batch(header: list[str], rows: list[list[Any]]) -> list[dict[str, Any]]:
+            raise KeyError("broken column")
+
+        monkeypatch.setattr(generate_random_sample, "convert_batch", failing_batch)
+
+        converted = convert_sample([{"_id": "id0", "code": "000001/001"}])
+
+        assert len(converted) == 1
+        output = capsys.readouterr().out
+        assert "Batch conversion failed" in output
+        assert "broken column" in output
@@ -0,0 +1,149 @@
+"""Tests for MUIS output model construction paths.
+
+MuisMuseaal's batch and fast constructors (validate_many, validate_row,
+from_trusted) must agree with the validating constructor.
+"""
+
+import pytest
+from typing import Any
+from pydantic import ValidationError
+from scripts.models import MuisMuseaal
+
+
+@pytest.fixture
+def museaal_data() -> dict[str, Any]:
+    """Minimal valid MuisMuseaal field mapping."""
+    return {"acr": "VBM", "trs": 20027, "trj": 117, "nimetus": "Enne lahkumist"}
+
+
+# Fields that trigger each dependency error when set alone
+DEPENDENCY_ERRORS = [
+    *[({f"vaartus_{i}": 168.0}, f"parameeter_{i} required") for i in range(1, 5)],
+    *[({f"parameeter_{i}": "kõrgus"}, f"vaartus_{i} required") for i in range(1, 5)],
+    *[({f"materjali_{i}_kommentaar": "x"}, f"materjal_{i} required") for i in range(1, 4)],
+    *[({f"tehnika_{i}_kommentaar": "x"}, f"tehnika_{i} required") for i in range(1, 4)],
+    *[({f"osaleja_{i}": "Tamm, Jaan"}, f"osaleja_roll_{i} required") for i in (1, 2)],
+    *[
+        ({f"toimumiskoha_tapsustus_kohanimi_{i}": "Tallinn"}, f"selgitus_{i} required")
+        for i in (1, 2)
+    ],
+    *[({f"dateeringu_lopp_{i}": "01.01.1950"}, f"dateering_algus_{i} required") for i in (1, 2)],
+    *[({f"teksti_tyyp_{i}": "kirjeldus"}, f"tekst_{i} required") for i in (1, 2)],
+    *[({f"tekst_{i}": "Foto"}, f"teksti_tyyp_{i} required") for i in (1, 2)],
+    ({"nimetuse_tyyp": "rahvapärane"}, "alt_nimetus required"),
+    ({"alt_nimetus": "Pilt"}, "nimetuse_tyyp required"),
+    ({"numbri_tyyp": "endine"}, "alt_number required"),
+    ({"alt_number": "A-1"}, "numbri_tyyp required"),
+    ({"seisund": "halb"}, "kahjustused required"),
+    ({"seisund": "väga halb"}, "kahjustused required"),
+    ({"viite_vaartus": "123"}, "viite_tyyp required"),
+    ({"leiu_liik": "juhuleid"}, "leiukontekst required"),
+]
+
+
+class TestValidateRow:
+    """validate_row() must agree with MuisMuseaal(**data)."""
+
+    def test_matches_constructor(self, museaal_data: dict[str, Any]) -> None:
+        """Valid data should give equal models with the same fields_set."""
+        validated = MuisMuseaal(**museaal_data)
+        constructed = MuisMuseaal.validate_row(museaal_data)
+
+        assert constructed.model_dump() == validated.model_dump()
+        assert constructed.model_fields_set == validated.model_fields_set
+
+    @pytest.mark.parametrize("field", ["eesti_admin_yksus_1", "kihelkond_2"])
+    def test_riik_normalization(self, museaal_data: dict[str, Any], field: str) -> None:
+        """Admin unit or parish should force riik to 'Eesti' and mark it set."""
+        museaal_data[field] = "Harjumaa"
+        museaal_data[f"riik_{field[-1]}"] = "Läti"
+        validated = MuisMuseaal(**museaal_data)
+        constructed = MuisMuseaal.validate_row(museaal_data)
+
+        assert validated.model_dump()[f"riik_{field[-1]}"] == "Eesti"
+        assert constructed.model_dump() == validated.model_dump()
+        assert constructed.model_fields_set == validated.model_fields_set
+
+    def test_riik_normalization_without_riik(self, museaal_data: dict[str, Any]) -> None:
+        """Normalized riik should be in fields_set even when not passed."""
+        museaal_data["kihelkond_1"] = "Jõelähtme"
+        validated = MuisMuseaal(**museaal_data)
+        constructed = MuisMuseaal.validate_row(museaal_data)
+
+        assert "riik_1" in validated.model_fields_set
+        assert constructed.model_fields_set == validated.model_fields_set
+
+    @pytest.mark.parametrize("field", ["acr", "trs", "nimetus"])
+    def test_missing_required_field(self, museaal_data: dict[str, Any], field: str) -> None:
+        """Both paths should reject a record without a required field."""
+        del museaal_data[field]
+
+        with pytest.raises(ValueError):
+            MuisMuseaal(**museaal_data)
+        with pytest.raises(ValueError, match=f"{field} is required"):
+            MuisMuseaal.validate_row(museaal_data)
+
+    @pytest.mark.parametrize("extra, message", DEPENDENCY_ERRORS)
+    def test_dependency_errors(
+        self, museaal_data: dict[str, Any], extra: dict[str, Any], message: str
+    ) -> None:
+        """Both paths should raise the same dependency error."""
+        museaal_data.update(extra)
+
+        with pytest.raises(ValueError, match=message):
+            MuisMuseaal(**museaal_data)
+        with pytest.raises(ValueError, match=message):
+            MuisMuseaal.validate_row(museaal_data)
+
+
+class TestFromTrusted:
+    """from_trusted() rebuilds validated records without validation."""
+
+    def test_round_trips_validated_dump(self, museaal_data: dict[str, Any]) -> None:
+        """A validated model's dump should rebuild an equal model."""
+        museaal_data.update({"kihelkond_1": "Jõelähtme", "parameeter_1": "kõrgus"})
+        museaal_data.update({"yhik_1": "mm", "vaartus_1": 168.0})
+        validated = MuisMuseaal(**museaal_data)
+        trusted = MuisMuseaal.from_trusted(validated.model_dump())
+
+        assert trusted == validated
+        assert trusted.model_dump() == validated.model_dump()
+
+    def test_missing_fields_take_defaults(self, museaal_data: dict[str, Any]) -> None:
+        """Fields left out should get the same defaults as the constructor."""
+        validated = MuisMuseaal(**museaal_data)
+        trusted = MuisMuseaal.from_trusted(museaal_data)
+
+        assert trusted.model_dump() == validated.model_dump()
+        assert trusted.model_fields_set == validated.model_fields_set
+
+
+class TestValidateMany:
+    """validate_many() validates a whole batch in one call."""
+
+    def test_matches_constructor(self, museaal_data: dict[str, Any]) -> None:
+        """Each item should equal the model built by the constructor."""
+        items = [museaal_data, {**museaal_data, "trs": 20028, "eesti_admin_yksus_1": "Harjumaa"}]
+
+        models = MuisMuseaal.validate_many(items)
+
+        assert models == [MuisMuseaal(**item) for item in items]
+        assert [m.model_fields_set for m in models] == [
+            MuisMuseaal(**item).model_fields_set for item in items
+        ]
+
+    def test_bad_item_error_has_index(self, museaal_data: dict[str, Any]) -> None:
+        """An invalid item should raise ValidationError located at its list index."""
+        items = [museaal_data, {**museaal_data, "osaleja_1": "Tamm, Jaan"}]
+
+        with pytest.raises(ValidationError) as exc_info:
+            MuisMuseaal.validate_many(items)
+
+        errors = exc_info.value.errors()
+        assert len(errors) == 1
+        assert errors[0]["loc"][0] == 1
+        assert "osaleja_roll_1 required" in errors[0]["msg"]
+
+    def test_empty_batch(self) -> None:
+        """An empty batch should give an empty list."""
+        assert MuisMuseaal.validate_many([]) == []
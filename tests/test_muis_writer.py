@@ -7,9 +7,12 @@ import csv
 import pytest
 from pathlib import Path
 from typing import Any
+from openpyxl import load_workbook
 from scripts.muis_writer import (
     write_muis_csv,
+    write_muis_excel,
     orchestrator_to_muis_row,
+    orchestrator_to_muis_values,
     MUIS_COLUMN_NAMES,
 )
 
@@ -104,6 +107,17 @@ class TestOrchestratorToMuisRow:
         for col in MUIS_COLUMN_NAMES:
             assert col in muis_row
 
+    def test_positional_row_matches_column_order(
+        self, sample_orchestrator_output: dict[str, Any]
+    ) -> None:
+        """Positional row should hold the row dict's values in MUIS column order."""
+        values = orchestrator_to_muis_values(sample_orchestrator_output)
+        muis_row = orchestrator_to_muis_row(sample_orchestrator_output)
+
+        assert values == [muis_row[col] for col in MUIS_COLUMN_NAMES]
+        assert values[MUIS_COLUMN_NAMES.index("Väärtus 2")] == 121
+        assert values[MUIS_COLUMN_NAMES.index("Avalik")] == ""
+
     def test_empty_fields_handled(self) -> None:
         """Empty orchestrator output should produce valid MUIS row."""
         empty_output: dict[str, Any] = {
@@ -159,6 +173,19 @@ class TestWriteMuisCsv:
 
         assert output_file.exists()
 
+    def test_write_muis_csv_accepts_generator(
+        self, tmp_path: Path, sample_orchestrator_output: dict[str, Any]
+    ) -> None:
+        """CSV writer should stream rows from any iterable, not just lists."""
+        output_file = tmp_path / "test_output.csv"
+
+        write_muis_csv((dict(sample_orchestrator_output) for _ in range(3)), output_file)
+
+        with open(output_file, "r", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+
+        assert len(rows) == 6
+
     def test_muis_csv_structure(
         self, tmp_path: Path, sample_orchestrator_output: dict[str, Any]
     ) -> None:
@@ -192,6 +219,7 @@ class TestWriteMuisCsv:
         assert len(metadata_row) == 91
         assert len(names_row) == 91
         assert len(validation_row) == 91
+        assert names_row == list(MUIS_COLUMN_NAMES)
 
     def test_muis_csv_column_names(
         self, tmp_path: Path, sample_orchestrator_output: dict[str, Any]
@@ -266,6 +294,48 @@ class TestWriteMuisCsv:
         assert data_row["Üleandja"] == "Miia Jõgiaas"
 
 
+class TestWriteMuisExcel:
+    """Tests for direct Excel writing (no intermediate CSV)."""
+
+    def test_excel_matches_csv_export(
+        self, tmp_path: Path, sample_orchestrator_output: dict[str, Any]
+    ) -> None:
+        """Excel cells should match the CSV export cell for cell."""
+        csv_file = tmp_path / "out.csv"
+        excel_file = tmp_path / "out.xlsx"
+
+        write_muis_csv([sample_orchestrator_output] * 2, csv_file)
+        write_muis_excel([sample_orchestrator_output] * 2, excel_file)
+
+        with open(csv_file, "r", encoding="utf-8") as f:
+            csv_rows = list(csv.reader(f))
+
+        wb = load_workbook(excel_file)
+        excel_rows = [
+            ["" if value is None else value for value in row]
+            for row in wb.active.iter_rows(values_only=True)  # type: ignore[union-attr]
+        ]
+        wb.close()
+
+        assert excel_rows == csv_rows
+
+    def test_excel_header_formatting(
+        self, tmp_path: Path, sample_orchestrator_output: dict[str, Any]
+    ) -> None:
+        """Header rows should be bold and frozen."""
+        excel_file = tmp_path / "out.xlsx"
+
+        write_muis_excel([sample_orchestrator_output], excel_file)
+
+        wb = load_workbook(excel_file)
+        ws = wb.active
+        assert ws.freeze_panes == "A4"  # type: ignore[union-attr]
+        assert ws.cell(2, 1).font.bold is True  # type: ignore[union-attr]
+        assert ws.cell(4, 4).font.bold is False  # type: ignore[union-attr]
+        assert ws.cell(4, 4).value == "VBM"  # type: ignore[union-attr]
+        wb.close()
+
+
 class TestVabamuFeedbackColumnMappings:
     """Tests for Vabamu feedback column mappings (GitHub issue #10)."""
 
@@ -0,0 +1,69 @@
+"""Tests for Loendid 1 classifier parsing.
+
+Loendid 1 holds 7 vocabularies side by side, 3 columns each
+(term_et, term_id, parent_id).
+"""
+
+from pathlib import Path
+import pytest
+from scripts.parse_loendid1 import VOCABULARY_COLUMNS, parse_loendid1_csv
+
+
+@pytest.fixture
+def loendid_csv(tmp_path: Path) -> Path:
+    """Loendid CSV with short rows, whitespace-only cells and blank lines."""
+    csv_path = tmp_path / "loendid1.csv"
+    csv_path.write_text(
+        "saadud annetusena,1,,diameeter,10,\n"
+        " , , ,kõrgus ,11,\n"
+        "\n"
+        "  ,\n"
+        "ostuna,2\n"
+        "kingitus\n"
+        ",,,,,,cm,5,,,,,,,,,,,graafika,700,7\n",
+        encoding="utf-8",
+    )
+    return csv_path
+
+
+class TestParseLoendid1Csv:
+    """Tests for parse_loendid1_csv function."""
+
+    def test_all_vocabularies_present(self, loendid_csv: Path) -> None:
+        """Every vocabulary key should be returned, even when empty."""
+        vocabularies = parse_loendid1_csv(str(loendid_csv))
+
+        assert list(vocabularies) == [name for name, _ in VOCABULARY_COLUMNS]
+        assert vocabularies["formats"] == []
+        assert vocabularies["colors"] == []
+        assert vocabularies["patterns"] == []
+
+    def test_short_rows_padded_with_empty_strings(self, loendid_csv: Path) -> None:
+        """Missing id/parent cells at the end of a row should become ''."""
+        vocabularies = parse_loendid1_csv(str(loendid_csv))
+
+        assert vocabularies["acquisition_methods"] == [
+            {"term_et": "saadud annetusena", "term_id": "1", "parent_id": ""},
+            {"term_et": "ostuna", "term_id": "2", "parent_id": ""},
+            {"term_et": "kingitus", "term_id": "", "parent_id": ""},
+        ]
+
+    def test_whitespace_only_cells_skipped_and_values_stripped(self, loendid_csv: Path) -> None:
+        """Whitespace-only terms add no entry; other values are trimmed."""
+        vocabularies = parse_loendid1_csv(str(loendid_csv))
+
+        assert vocabularies["measurement_types"] == [
+            {"term_et": "diameeter", "term_id": "10", "parent_id": ""},
+            {"term_et": "kõrgus", "term_id": "11", "parent_id": ""},
+        ]
+
+    def test_column_groups_mapped_by_position(self, loendid_csv: Path) -> None:
+        """Terms in later column groups should land in their own vocabulary."""
+        vocabularies = parse_loendid1_csv(str(loendid_csv))
+
+        assert vocabularies["measurement_units"] == [
+            {"term_et": "cm", "term_id": "5", "parent_id": ""}
+        ]
+        assert vocabularies["techniques"] == [
+            {"term_et": "graafika", "term_id": "700", "parent_id": "7"}
+        ]
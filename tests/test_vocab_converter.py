@@ -283,6 +283,37 @@ class TestLoadVocabulary:
 
         assert "empty" in str(exc_info.value).lower() or "min_length" in str(exc_info.value).lower()
 
+    @pytest.mark.parametrize(
+        "column_count, content, model",
+        [
+            (3, "kollane\t1522\t3\nõpik\t1111\t100\n", VocabularyEntry3),
+            (4, "kollane\t1522\t3\t100\nõpik\t1111\t100\t101\n", VocabularyEntry4),
+        ],
+    )
+    def test_entries_match_validated_models(
+        self, tmp_path: Path, column_count: int, content: str, model: type
+    ) -> None:
+        """
+        GIVEN: Valid 3- or 4-column TSV file
+        WHEN: load_vocabulary_from_tsv is called
+        THEN: Entries dump the same as models built by the validating constructor
+        """
+        # Arrange
+        test_file = tmp_path / "vocab.txt"
+        test_file.write_text(content, encoding="utf-8")
+        field_names = ("term", "term_id", "parent_id", "muis_id")[:column_count]
+        expected = [
+            model(**dict(zip(field_names, line.split("\t")))).model_dump()
+            for line in content.splitlines()
+        ]
+
+        # Act
+        entries = load_vocabulary_from_tsv(test_file, column_count=column_count)
+
+        # Assert
+        assert all(type(entry) is model for entry in entries)
+        assert [entry.model_dump() for entry in entries] == expected
+
 
 class TestVocabularyConverter:
     """Test main vocabulary conversion workflow."""